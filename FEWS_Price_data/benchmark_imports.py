@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+FEWS NET Dashboard Import Benchmark
+===================================
+Measures how long the dashboard takes to import its dependencies on a cold
+start, and which heavy modules each import pulls in.
+
+Each case runs in a fresh interpreter (nothing cached in sys.modules), is
+repeated --repeat times and reports:
+- median and minimum wall time of the import
+- whether Prophet, cmdstanpy and plotly.express were loaded by it
+
+Cases:
+- app: the module-level imports of dashboard/app.py (read from its source,
+  so the UI itself is not run)
+- forecasting: dashboard/forecasting.py, which imports Prophet only when a
+  Prophet model is fitted or loaded
+- prophet: Prophet itself, the cost the lazy import defers
+
+Results are written as JSON to stdout (progress goes to stderr), so runs
+can be saved and compared when adding dashboard dependencies.
+
+Usage:
+    python benchmark_imports.py > imports.json
+    python benchmark_imports.py --cases app --repeat 10
+
+Requirements:
+    pip install -r dashboard/requirements.txt
+"""
+
+import argparse
+import ast
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+DASHBOARD_DIR = Path(__file__).parent / "dashboard"
+CASES = ["app", "forecasting", "prophet"]
+HEAVY_MODULES = ["prophet", "cmdstanpy", "plotly.express"]
+
+# Run in the child interpreter: time the import, then report loaded modules
+CHILD_TEMPLATE = """
+import json, sys, time
+sys.path.insert(0, {dashboard_dir!r})
+start = time.perf_counter()
+{statements}
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "loaded": [m for m in {heavy_modules!r} if m in sys.modules],
+}}))
+"""
+
+
+def log(message: str):
+    """Print progress to stderr, keeping stdout for the JSON results."""
+    print(message, file=sys.stderr, flush=True)
+
+
+def app_import_statements() -> str:
+    """
+    Collect the module-level import statements of dashboard/app.py.
+
+    Returns:
+        Source lines of every top-level import, in file order
+    """
+    source = (DASHBOARD_DIR / "app.py").read_text()
+    tree = ast.parse(source)
+    statements = [
+        ast.get_source_segment(source, node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    return "\n".join(statements)
+
+
+def case_statements(case: str) -> str:
+    """Import statements timed by a case."""
+    if case == "app":
+        return app_import_statements()
+    if case == "forecasting":
+        return "import forecasting"
+    if case == "prophet":
+        return "import prophet"
+    raise ValueError(f"Unknown case: {case}")
+
+
+def run_case(case: str, repeat: int) -> dict:
+    """
+    Time one case in `repeat` fresh interpreters.
+
+    Args:
+        case: Case name (see CASES)
+        repeat: Number of cold starts to measure
+
+    Returns:
+        Dictionary of timings and the heavy modules the import loaded
+    """
+    code = CHILD_TEMPLATE.format(
+        dashboard_dir=str(DASHBOARD_DIR),
+        statements=case_statements(case),
+        heavy_modules=HEAVY_MODULES,
+    )
+
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1]
+            return {"case": case, "error": error}
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+
+    return {
+        "case": case,
+        "repeat": repeat,
+        "median_ms": round(statistics.median(timings) * 1000, 1),
+        "min_ms": round(min(timings) * 1000, 1),
+        "loaded": loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure cold-start import time of the FEWS NET dashboard"
+    )
+    parser.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help=f"Comma-separated cases (default: {','.join(CASES)})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Cold starts measured per case (default: 5)",
+    )
+    args = parser.parse_args()
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error(f"Unknown case(s): {', '.join(unknown)}")
+
+    results = []
+    for case in cases:
+        log(f"[INFO] {case}: {args.repeat} cold start(s)")
+        result = run_case(case, args.repeat)
+        if "error" in result:
+            log(f"[ERROR] {case}: {result['error']}")
+        else:
+            loaded = ", ".join(result["loaded"]) or "none"
+            log(f"[OK] {case}: median {result['median_ms']} ms "
+                f"(heavy modules loaded: {loaded})")
+        results.append(result)
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
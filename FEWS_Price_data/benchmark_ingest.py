@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+FEWS NET Ingest Benchmark
+=========================
+Measures FEWSDatabase ingest throughput on synthetic marketpricefacts data.
+
+Synthetic DataFrames use the column layout of data/haiti_Beans_Black.csv,
+with many markets, products and units and 20 years of monthly periods per
+series. Each case runs in a fresh process against a temporary DuckDB file
+and reports:
+- rows/sec and wall time
+- peak RSS of the process (before and after the timed section)
+- SQL statements and transactions sent to DuckDB
+
+Row-at-a-time cases (sync_row, sync_batched, upsert, dimensions) are
+measured on at most --row-limit rows of each size, since a million-row row
+path run takes hours. The JSON records the rows actually measured.
+
+Results are written as JSON to stdout (progress goes to stderr), so runs
+can be saved and compared to spot regressions in the sync path.
+
+Usage:
+    # Default sizes 10k, 100k and 1M rows, all cases
+    python benchmark_ingest.py > bench.json
+
+    # Quick run of the bulk path only
+    python benchmark_ingest.py --sizes 10000 --cases sync_bulk,resync_bulk
+
+Requirements:
+    pip install duckdb pandas requests
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database.fews_database import FEWSDatabase
+from fewsnet_haiti_downloader import PRICE_DTYPES, apply_column_plan
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TEMPLATE_CSV = Path(__file__).parent / "data" / "haiti_Beans_Black.csv"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+ROW_LIMIT = 10_000  # Rows measured by the row-at-a-time cases
+BATCH_SIZE = 5000  # batch_size for the sync_batched case
+MONTHS = 240  # Monthly periods per synthetic series (2005-2024)
+PRODUCTS = 43
+UNITS = ["6_lb", "marmite", "kg"]
+
+CASES = {
+    "sync_bulk": "sync_dataframe(bulk=True) into an empty database",
+    "resync_bulk": "sync_dataframe(bulk=True) of unchanged rows (all skipped)",
+    "sync_batched": f"sync_dataframe(batch_size={BATCH_SIZE}) row path",
+    "sync_row": "sync_dataframe() row path",
+    "upsert": "upsert_price_observation with dimensions already resolved",
+    "dimensions": "get_or_create_market/product/unit/source per row",
+}
+ROW_CASES = {"sync_batched", "sync_row", "upsert", "dimensions"}
+
+
+def log(message: str):
+    """Print progress to stderr, keeping stdout for the JSON results."""
+    print(message, file=sys.stderr, flush=True)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class CountingConnection:
+    """Wraps a DuckDB connection and counts the statements sent through it."""
+
+    def __init__(self, con):
+        self._con = con
+        self.statements = 0
+        self.transactions = 0
+
+    def execute(self, *args, **kwargs):
+        self.statements += 1
+        return self._con.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self.statements += 1
+        return self._con.executemany(*args, **kwargs)
+
+    def begin(self):
+        self.transactions += 1
+        return self._con.begin()
+
+    def __getattr__(self, name):
+        return getattr(self._con, name)
+
+
+def synthetic_prices(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build a marketpricefacts-shaped DataFrame with the template CSV's columns.
+
+    Rows are laid out as series of MONTHS monthly observations. Series are
+    spread over PRODUCTS products, len(UNITS) units and as many markets as
+    needed, so the natural key (market, product, unit, period_date,
+    price_type) is unique. Columns the sync does not read keep the
+    template's first-row values.
+
+    Args:
+        rows: Number of rows to generate
+        seed: Random seed for prices and exchange rates
+
+    Returns:
+        DataFrame with PRICE_DTYPES applied, as FEWSNETClient returns it
+    """
+    rng = np.random.default_rng(seed)
+    template = pd.read_csv(TEMPLATE_CSV, nrows=1)
+
+    idx = np.arange(rows)
+    series = idx // MONTHS
+    n_series = int(series.max()) + 1 if rows else 0
+    n_markets = max(11, -(-n_series // (PRODUCTS * len(UNITS))))
+    market = series % n_markets
+    product = (series // n_markets) % PRODUCTS
+    unit = (series // (n_markets * PRODUCTS)) % len(UNITS)
+
+    months = pd.period_range("2005-01", periods=MONTHS, freq="M")
+    month = months[idx % MONTHS]
+
+    value = np.round(rng.lognormal(mean=5, sigma=0.6, size=rows), 2)
+    exchange_rate = np.round(rng.uniform(0.007, 0.03, size=rows), 5)
+
+    df = pd.DataFrame({col: np.repeat(template[col].to_numpy(), rows) for col in template.columns})
+    df["market_id"] = 50000 + market
+    df["fnid"] = [f"HT{m:04d}M001" for m in market]
+    df["market"] = [f"Market {m:03d}" for m in market]
+    df["admin_1"] = [f"Admin {m % 10}" for m in market]
+    df["admin_2"] = df["market"]
+    df["latitude"] = 18 + market % 100 / 50
+    df["longitude"] = -74 + market % 100 / 25
+    df["product"] = [f"Product {p:02d}" for p in product]
+    df["cpcv2"] = [f"R{p:07d}" for p in product]
+    df["product_source"] = np.where(product % 2, "Import", "Local")
+    df["unit"] = np.asarray(UNITS)[unit]
+    df["dataseries"] = 100000 + series
+    df["period_date"] = month.to_timestamp(how="end").normalize()
+    df["start_date"] = month.to_timestamp(how="start")
+    df["value"] = value
+    df["exchange_rate"] = exchange_rate
+    df["common_unit_price"] = value / 2.72
+    df["common_currency_price"] = value * exchange_rate
+
+    return apply_column_plan(df, dtypes=PRICE_DTYPES)
+
+
+def _run_case(case: str, rows: int, row_limit: int, seed: int, queue):
+    """Run one benchmark case in this (fresh) process and put its result on queue."""
+    # FEWSDatabase reports progress with print(); keep stdout for the JSON
+    sys.stdout = sys.stderr
+    measured = min(rows, row_limit) if case in ROW_CASES else rows
+    df = synthetic_prices(measured, seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = FEWSDatabase(Path(tmp) / "bench.duckdb").connect()
+        # The progress bar writes to the stdout file descriptor directly
+        db.con.execute("SET enable_progress_bar = false")
+        db.create_tables()
+
+        if case == "resync_bulk":
+            db.sync_dataframe(df, bulk=True)
+        elif case == "upsert":
+            records = df.to_dict("records")
+            keys = [
+                (db.get_or_create_market(row), db.get_or_create_product(row),
+                 db.get_or_create_unit(row), db.get_or_create_source(row))
+                for row in records
+            ]
+        elif case == "dimensions":
+            records = df.to_dict("records")
+
+        counter = CountingConnection(db.con)
+        db.con = counter
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+
+        if case in ("sync_bulk", "resync_bulk"):
+            stats = db.sync_dataframe(df, bulk=True)
+        elif case == "sync_batched":
+            stats = db.sync_dataframe(df, batch_size=BATCH_SIZE)
+        elif case == "sync_row":
+            stats = db.sync_dataframe(df)
+        elif case == "upsert":
+            stats = {}
+            for row, (market_id, product_id, unit_id, source_id) in zip(records, keys):
+                result = db.upsert_price_observation(row, market_id, product_id, unit_id, source_id)
+                stats[result] = stats.get(result, 0) + 1
+        elif case == "dimensions":
+            for row in records:
+                db.get_or_create_market(row)
+                db.get_or_create_product(row)
+                db.get_or_create_unit(row)
+                db.get_or_create_source(row)
+            stats = {}
+
+        elapsed = time.perf_counter() - start
+        db.con = counter._con
+        db.close()
+
+    queue.put({
+        "case": case,
+        "rows": rows,
+        "rows_measured": measured,
+        "seconds": round(elapsed, 4),
+        "rows_per_sec": round(measured / elapsed, 1) if elapsed > 0 else None,
+        "peak_rss_mb_before": rss_before,
+        "peak_rss_mb": peak_rss_mb(),
+        "statements": counter.statements,
+        "transactions": counter.transactions,
+        "stats": {key: value for key, value in stats.items() if isinstance(value, int)},
+    })
+
+
+def run_case(case: str, rows: int, row_limit: int, seed: int) -> dict:
+    """Run a benchmark case in a fresh process so peak RSS is per case."""
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_run_case, args=(case, rows, row_limit, seed, queue))
+    process.start()
+    try:
+        result = queue.get()
+    finally:
+        process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark FEWSDatabase ingest on synthetic price data (JSON to stdout)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Cases:\n" + "\n".join(f"  {name:<13} {desc}" for name, desc in CASES.items()),
+    )
+    parser.add_argument("--sizes", type=str, default=",".join(map(str, DEFAULT_SIZES)),
+                        metavar="N,N", help="Comma-separated row counts (default: 10k,100k,1M)")
+    parser.add_argument("--cases", type=str, default=",".join(CASES), metavar="NAME,NAME",
+                        help="Comma-separated cases to run (default: all)")
+    parser.add_argument("--row-limit", type=int, default=ROW_LIMIT, metavar="N",
+                        help=f"Rows measured by row-at-a-time cases (default: {ROW_LIMIT})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic prices")
+    parser.add_argument("--output", type=str, metavar="PATH",
+                        help="Also write the JSON results to PATH")
+
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error(f"Unknown case(s): {', '.join(unknown)}")
+
+    results = []
+    for rows in sizes:
+        for case in cases:
+            log(f"[INFO] {case} @ {rows} rows...")
+            result = run_case(case, rows, args.row_limit, args.seed)
+            log(f"[OK] {case} @ {rows}: {result['rows_measured']} rows in "
+                f"{result['seconds']:.2f}s ({result['rows_per_sec']:,.0f} rows/s, "
+                f"{result['statements']} statements, peak RSS {result['peak_rss_mb']} MB)")
+            results.append(result)
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "row_limit": args.row_limit,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        log(f"[OK] Results saved to: {args.output}")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
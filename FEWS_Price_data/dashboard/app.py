@@ -12,13 +12,15 @@ Deploy to Streamlit Cloud:
     3. Set app path: FEWS_Price_data/dashboard/app.py
 """
 
+import threading
+
 import streamlit as st
 import duckdb
 import pandas as pd
-import plotly.express as px
+import plotly.colors as plotly_colors
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from pathlib import Path
-from forecasting import fit_all_models, generate_all_forecasts, ForecastResult
 
 # Page config
 st.set_page_config(
@@ -33,9 +35,47 @@ DB_PATH = Path(__file__).parent.parent / "database" / "fews_haiti.duckdb"
 
 
 @st.cache_resource
+def _connection_state():
+    """Shared connection slot, keyed by the database file it was opened on."""
+    return {"lock": threading.Lock(), "version": None, "con": None}
+
+
+def _open_database():
+    """
+    Open DB_PATH read-only in a new in-memory DuckDB instance.
+
+    The file is attached rather than opened with duckdb.connect(DB_PATH),
+    which would hand back DuckDB's cached instance of a replaced file while
+    any connection to it is still open.
+    """
+    con = duckdb.connect()
+    path = str(DB_PATH).replace("'", "''")
+    con.execute(f"ATTACH '{path}' AS fews (READ_ONLY)")
+    return con
+
+
 def get_connection():
-    """Get database connection (cached)."""
-    return duckdb.connect(str(DB_PATH), read_only=True)
+    """
+    Get a cursor on the cached database connection.
+
+    `sync_fews_db.py --staged` replaces the database file atomically, so the
+    database is reopened whenever the file's inode or mtime changes. The old
+    connection is not closed: sessions still querying it keep their cursors,
+    and it is released once the last of them is garbage collected.
+    """
+    state = _connection_state()
+    stat = DB_PATH.stat()
+    version = (stat.st_ino, stat.st_mtime_ns)
+
+    with state["lock"]:
+        if state["version"] != version:
+            state["con"] = _open_database()
+            state["version"] = version
+        cursor = state["con"].cursor()
+
+    # Each caller gets its own cursor, so concurrent sessions never share one
+    cursor.execute("USE fews")
+    return cursor
 
 
 @st.cache_data(ttl=3600)
@@ -44,10 +84,9 @@ def get_commodities():
     con = get_connection()
     df = con.execute(
         """
-        SELECT DISTINCT p.name
-        FROM products p
-        JOIN price_observations po ON p.id = po.product_id
-        ORDER BY p.name
+        SELECT DISTINCT product AS name
+        FROM price_observations_wide
+        ORDER BY name
     """
     ).fetchdf()
 
@@ -69,10 +108,9 @@ def get_markets():
     con = get_connection()
     df = con.execute(
         """
-        SELECT DISTINCT m.name
-        FROM markets m
-        JOIN price_observations po ON m.id = po.market_id
-        ORDER BY m.name
+        SELECT DISTINCT market AS name
+        FROM price_observations_wide
+        ORDER BY name
     """
     ).fetchdf()
     return df["name"].tolist()
@@ -80,22 +118,22 @@ def get_markets():
 
 @st.cache_data(ttl=3600)
 def get_mean_prices(commodity: str):
-    """Get mean price across all markets for a commodity."""
+    """Get mean price across all markets for a commodity (materialized at sync time)."""
     con = get_connection()
     df = con.execute(
         """
         SELECT
-            po.period_date,
-            AVG(po.value) AS mean_price_htg,
-            AVG(po.common_currency_price) AS mean_price_usd,
-            MIN(po.value) AS min_price_htg,
-            MAX(po.value) AS max_price_htg,
-            COUNT(DISTINCT po.market_id) AS num_markets
-        FROM price_observations po
-        JOIN products p ON po.product_id = p.id
-        WHERE p.name = ?
-        GROUP BY po.period_date
-        ORDER BY po.period_date
+            period_date,
+            mean_price_htg,
+            mean_price_usd,
+            min_price_htg,
+            max_price_htg,
+            num_markets,
+            mean_norm_price_htg,
+            mean_norm_price_usd
+        FROM agg_product_monthly
+        WHERE product = ?
+        ORDER BY period_date
     """,
         [commodity],
     ).fetchdf()
@@ -105,20 +143,20 @@ def get_mean_prices(commodity: str):
 
 @st.cache_data(ttl=3600)
 def get_market_prices(commodity: str):
-    """Get individual market prices for a commodity."""
+    """Get individual market prices for a commodity (pre-joined at sync time)."""
     con = get_connection()
     df = con.execute(
         """
         SELECT
-            m.name AS market,
-            po.period_date,
-            po.value AS price_htg,
-            po.common_currency_price AS price_usd
-        FROM price_observations po
-        JOIN markets m ON po.market_id = m.id
-        JOIN products p ON po.product_id = p.id
-        WHERE p.name = ?
-        ORDER BY po.period_date, m.name
+            market,
+            period_date,
+            value AS price_htg,
+            common_currency_price AS price_usd,
+            norm_price AS norm_price_htg,
+            norm_price_usd
+        FROM price_observations_wide
+        WHERE product = ?
+        ORDER BY period_date, market
     """,
         [commodity],
     ).fetchdf()
@@ -133,12 +171,38 @@ def get_date_range():
     result = con.execute(
         """
         SELECT MIN(period_date) AS min_date, MAX(period_date) AS max_date
-        FROM price_observations
+        FROM price_observations_wide
     """
     ).fetchone()
     return pd.to_datetime(result[0]), pd.to_datetime(result[1])
 
 
+@st.cache_data(ttl=3600)
+def get_stored_forecasts(commodity: str, currency: str, model: str = "prophet"):
+    """Get forecasts precomputed after the last sync (sync_fews_db.py --forecasts)."""
+    con = get_connection()
+    models_df = con.execute(
+        """
+        SELECT market, n_observations, months_span, sufficient, reason, success, error
+        FROM forecast_models
+        WHERE product = ? AND currency = ? AND model = ?
+        ORDER BY market
+    """,
+        [commodity, currency, model],
+    ).fetchdf()
+    forecast_df = con.execute(
+        """
+        SELECT market, ds, is_forecast, yhat, yhat_lower, yhat_upper, trend, yearly
+        FROM forecasts
+        WHERE product = ? AND currency = ? AND model = ?
+        ORDER BY market, ds
+    """,
+        [commodity, currency, model],
+    ).fetchdf()
+    forecast_df["ds"] = pd.to_datetime(forecast_df["ds"])
+    return models_df, forecast_df
+
+
 def calculate_statistics(df: pd.DataFrame, price_col: str) -> dict:
     """Calculate summary statistics for the price data."""
     if df.empty:
@@ -191,9 +255,22 @@ def main():
     # Currency toggle
     currency = st.sidebar.radio("Currency", ["HTG (Haitian Gourde)", "USD"], index=0)
     use_usd = currency == "USD"
+    currency_symbol = "$" if use_usd else "HTG "
+
+    # Unit toggle: prices converted to kg / L at sync, so units can be mixed
+    per_unit = st.sidebar.checkbox(
+        "Price per kg / L",
+        value=False,
+        help="Convert each unit (e.g. 6 lb, marmite) to a price per kg or litre",
+    )
     price_col = "mean_price_usd" if use_usd else "mean_price_htg"
     market_price_col = "price_usd" if use_usd else "price_htg"
-    currency_symbol = "$" if use_usd else "HTG "
+    # Forecasts are fitted on prices as reported, so plot history the same way
+    history_price_col = market_price_col
+    if per_unit:
+        price_col = price_col.replace("mean_price", "mean_norm_price")
+        market_price_col = "norm_" + market_price_col
+    unit_label = " per kg / L" if per_unit else ""
 
     # Date range
     min_date, max_date = get_date_range()
@@ -277,15 +354,17 @@ def main():
                 "mean_price_usd",
                 "min_price_htg",
                 "max_price_htg",
+                "mean_norm_price_htg",
+                "mean_norm_price_usd",
             ]:
                 if col in plot_df.columns:
                     plot_df[col] = plot_df[col].interpolate(method="linear")
 
             plot_df = plot_df.reset_index().rename(columns={"index": "period_date"})
 
-            # Calculate min/max in selected currency
-            if use_usd:
-                ratio = plot_df["mean_price_usd"] / plot_df["mean_price_htg"]
+            # Calculate min/max in selected currency (and unit)
+            if use_usd or per_unit:
+                ratio = plot_df[price_col] / plot_df["mean_price_htg"]
                 min_price = plot_df["min_price_htg"] * ratio
                 max_price = plot_df["max_price_htg"] * ratio
             else:
@@ -377,7 +456,7 @@ def main():
 
             fig.update_layout(
                 xaxis_title="Date",
-                yaxis_title=f"Price ({currency.split()[0]})",
+                yaxis_title=f"Price ({currency.split()[0]}{unit_label})",
                 hovermode="x unified",
                 legend=dict(orientation="h", yanchor="bottom", y=1.02),
                 margin=dict(l=0, r=0, t=30, b=0),
@@ -436,7 +515,7 @@ def main():
             )
 
             # Add individual market lines
-            colors = px.colors.qualitative.Set2
+            colors = plotly_colors.qualitative.Set2
             for i, market in enumerate(selected_markets):
                 if market in pivot_df.columns:
                     fig.add_trace(
@@ -453,7 +532,7 @@ def main():
 
             fig.update_layout(
                 xaxis_title="Date",
-                yaxis_title=f"Price ({currency.split()[0]})",
+                yaxis_title=f"Price ({currency.split()[0]}{unit_label})",
                 hovermode="x unified",
                 legend=dict(orientation="h", yanchor="bottom", y=1.02),
                 margin=dict(l=0, r=0, t=30, b=0),
@@ -475,26 +554,28 @@ def main():
 
     with tab3:
         st.subheader(f"8-Month Price Forecast: {selected_commodity}")
-        st.markdown(
-            "*Forecasts generated using Facebook Prophet with automatic seasonality detection*"
-        )
-
-        # Initialize session state for model caching
-        if "forecast_models" not in st.session_state:
-            st.session_state.forecast_models = {}
-        if "forecast_product" not in st.session_state:
-            st.session_state.forecast_product = None
-        if "forecast_currency" not in st.session_state:
-            st.session_state.forecast_currency = None
-
-        # Check if we need to refresh models
-        need_refresh = (
-            st.session_state.forecast_product != selected_commodity
-            or st.session_state.forecast_currency != currency
-        )
-
         # Controls
-        col1, col2 = st.columns([3, 1])
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col2:
+            forecast_model = st.radio(
+                "Model",
+                options=["Prophet", "Fast baseline"],
+                horizontal=True,
+                help="Fast baseline: last observed price with monthly seasonality, "
+                "fitted in milliseconds without Prophet",
+            )
+        model_key = "fast" if forecast_model == "Fast baseline" else "prophet"
+        if model_key == "fast":
+            st.markdown(
+                "*Forecasts from a seasonal random walk (last observed price with "
+                "monthly seasonality), refreshed after each data sync*"
+            )
+        else:
+            st.markdown(
+                "*Forecasts generated using Facebook Prophet with automatic seasonality "
+                "detection, refreshed after each data sync*"
+            )
+
         with col1:
             forecast_horizon = st.slider(
                 "Forecast Horizon (Months)",
@@ -503,46 +584,45 @@ def main():
                 value=8,
                 help="Number of months to forecast into the future",
             )
-        with col2:
-            refresh_button = st.button(
-                "🔄 Refresh Models", help="Re-train Prophet models with latest data"
+        with col3:
+            reload_button = st.button(
+                "🔄 Reload Forecasts",
+                help="Re-read the forecasts stored by the last sync",
             )
 
-        if refresh_button:
-            need_refresh = True
-            st.session_state.forecast_models = {}
-
-        # Fit models if needed
-        if need_refresh or not st.session_state.forecast_models:
-            with st.spinner("Training Prophet models... This may take a minute."):
-                results, availability = fit_all_models(
-                    str(DB_PATH),
-                    selected_commodity,
-                    currency="USD" if use_usd else "HTG",
-                    min_months=24,
-                )
+        if reload_button:
+            get_stored_forecasts.clear()
 
-                st.session_state.forecast_models = results
-                st.session_state.forecast_availability = availability
-                st.session_state.forecast_product = selected_commodity
-                st.session_state.forecast_currency = currency
-        else:
-            results = st.session_state.forecast_models
-            availability = st.session_state.forecast_availability
+        # Models are fitted by sync_fews_db.py after each sync, never in this request
+        models_df, stored_df = get_stored_forecasts(
+            selected_commodity, "USD" if use_usd else "HTG", model_key
+        )
+        model_rows = models_df.to_dict("records")
+        availability = {
+            row["market"]: row for row in model_rows if row["market"] != "Market Average"
+        }
+        results = {row["market"]: row for row in model_rows if not pd.isna(row["success"])}
+
+        # Keep the fitted history and the first forecast_horizon future months
+        future_rank = stored_df[stored_df["is_forecast"]].groupby("market").cumcount()
+        stored_df = stored_df.drop(future_rank[future_rank >= forecast_horizon].index)
+        forecasts = {
+            market_name: market_forecast.reset_index(drop=True)
+            for market_name, market_forecast in stored_df.groupby("market", sort=False)
+        }
 
         if not results:
             st.warning(
-                "No data available for forecasting. This commodity may not have sufficient historical data."
+                "No data available for forecasting. This commodity may not have sufficient "
+                "historical data, or forecasts have not been computed yet "
+                "(`python sync_fews_db.py --forecasts`)."
             )
         else:
-            # Generate forecasts
-            forecasts = generate_all_forecasts(results, periods=forecast_horizon)
-
             # Market selector with availability info
             available_markets = [
                 m
                 for m in results.keys()
-                if results[m].success and m != "Market Average"
+                if results[m]["success"] and m != "Market Average"
             ]
 
             # Create market options with tooltips
@@ -564,7 +644,6 @@ def main():
                 # Show market average forecast
                 if "Market Average" in forecasts:
                     forecast_df = forecasts["Market Average"]
-                    model = results["Market Average"].model
 
                     # Split historical and future
                     historical_df = forecast_df[
@@ -670,20 +749,57 @@ def main():
                             )
                         st.dataframe(table_df, use_container_width=True)
 
-                    # Prophet components
+                    # Model components (stored with the forecast)
                     with st.expander("🔍 Model Components (Trend & Seasonality)"):
-                        from prophet.plot import plot_components_plotly
-
-                        components_fig = plot_components_plotly(model, forecast_df)
-                        st.plotly_chart(components_fig, use_container_width=True)
-                        st.caption(
-                            "Prophet automatically detects and separates trend and seasonal patterns"
+                        components_fig = make_subplots(
+                            rows=2,
+                            cols=1,
+                            subplot_titles=("Trend", "Yearly Seasonality (% effect)"),
                         )
+                        components_fig.add_trace(
+                            go.Scatter(
+                                x=forecast_df["ds"],
+                                y=forecast_df["trend"],
+                                mode="lines",
+                                line=dict(color="blue", width=2),
+                            ),
+                            row=1,
+                            col=1,
+                        )
+                        if forecast_df["yearly"].notna().any():
+                            seasonal = (
+                                forecast_df.groupby(forecast_df["ds"].dt.month)["yearly"]
+                                .mean()
+                                .mul(100)
+                            )
+                            components_fig.add_trace(
+                                go.Scatter(
+                                    x=pd.to_datetime(seasonal.index, format="%m").strftime("%b"),
+                                    y=seasonal.values,
+                                    mode="lines+markers",
+                                    line=dict(color="blue", width=2),
+                                ),
+                                row=2,
+                                col=1,
+                            )
+                        components_fig.update_layout(height=500, showlegend=False)
+                        st.plotly_chart(components_fig, use_container_width=True)
+                        if model_key == "fast":
+                            st.caption(
+                                "Seasonal random walk: the trend is fitted over the last "
+                                "36 months of history and held flat at the last observed "
+                                "level over the forecast horizon; the seasonal pattern is "
+                                "the monthly effect estimated over the same window"
+                            )
+                        else:
+                            st.caption(
+                                "Prophet automatically detects and separates trend and seasonal patterns"
+                            )
 
                 else:
                     st.error("Market average forecast failed to generate.")
-                    if "Market Average" in results and results["Market Average"].error:
-                        st.error(f"Error: {results['Market Average'].error}")
+                    if "Market Average" in results and results["Market Average"]["error"]:
+                        st.error(f"Error: {results['Market Average']['error']}")
 
             else:  # Individual Markets
                 selected_forecast_markets = st.multiselect(
@@ -707,7 +823,7 @@ def main():
 
                     # Create combined plot
                     fig = go.Figure()
-                    colors = px.colors.qualitative.Set2
+                    colors = plotly_colors.qualitative.Set2
 
                     for i, market_name in enumerate(selected_forecast_markets):
                         color = colors[i % len(colors)]
@@ -715,7 +831,7 @@ def main():
                         # Convert color to rgba format if needed
                         if color.startswith("#"):
                             # Hex color - convert to rgb
-                            rgb = px.colors.hex_to_rgb(color)
+                            rgb = plotly_colors.hex_to_rgb(color)
                             rgba_fill = f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, 0.1)"
                         elif color.startswith("rgb("):
                             # Already rgb format - extract values and add alpha
@@ -737,7 +853,7 @@ def main():
                             fig.add_trace(
                                 go.Scatter(
                                     x=market_historical["period_date"].tail(36),
-                                    y=market_historical[market_price_col].tail(36),
+                                    y=market_historical[history_price_col].tail(36),
                                     mode="lines",
                                     name=f"{market_name}",
                                     line=dict(color=color, width=2),
@@ -789,10 +905,10 @@ def main():
                             # Show info that forecast is not available but historical data is shown
                             if (
                                 market_name in results
-                                and not results[market_name].success
+                                and not results[market_name]["success"]
                             ):
                                 st.warning(
-                                    f"**{market_name}**: Forecast unavailable ({results[market_name].error}), but historical data is shown"
+                                    f"**{market_name}**: Forecast unavailable ({results[market_name]['error']}), but historical data is shown"
                                 )
                             elif market_name not in results:
                                 st.warning(
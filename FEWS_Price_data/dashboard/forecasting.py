@@ -3,21 +3,55 @@ Price forecasting module using Facebook Prophet for time series prediction.
 
 This module provides functionality to:
 - Fit Prophet models per market for a given commodity
+- Fit a fast NumPy baseline (seasonal random walk) instead of Prophet
 - Generate market-average forecasts
 - Handle data availability requirements (minimum 24 months)
 - Produce forecasts with confidence intervals
+- Fit the models in parallel on a process pool
+- Cache fitted models on disk until their data changes
 """
 
+import hashlib
+import json
+import multiprocessing
+import os
+import numpy as np
 import pandas as pd
 import duckdb
-from prophet import Prophet
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 import logging
 
+# Prophet (and cmdstan) load slowly, so they are imported where first used
+if TYPE_CHECKING:
+    from prophet import Prophet
+
 # Configure logging
 logging.getLogger("prophet").setLevel(logging.WARNING)
 logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
 
+# Forecasting backends for fit_all_models
+BACKENDS = ("prophet", "fast")
+
+# Fast baseline: fitted on the last BASELINE_WINDOW_MONTHS months of a series
+BASELINE_WINDOW_MONTHS = 36
+BASELINE_MIN_OBSERVATIONS = 18
+BASELINE_RIDGE = 0.01  # Keeps unobserved months at no seasonal effect
+INTERVAL_Z = 1.959964  # 95% intervals, like Prophet's interval_width=0.95
+
+# Processes used by fit_all_models (1 fits in this process, one model at a time)
+FIT_WORKERS = os.cpu_count() or 1
+
+# Process pool kept across calls, so workers import Prophet only once
+_fit_pool = None
+_fit_pool_workers = 0
+
+# Fitted models cached on disk as Prophet JSON, least recently used evicted first
+MODEL_CACHE_DIR = Path(__file__).parent / ".model_cache"
+MODEL_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
 
 class ForecastResult:
     """Container for forecast results and metadata."""
@@ -27,7 +61,7 @@ class ForecastResult:
         market_name: str,
         success: bool,
         forecast: Optional[pd.DataFrame] = None,
-        model: Optional[Prophet] = None,
+        model: Optional["Prophet"] = None,
         error: Optional[str] = None,
         n_observations: int = 0,
     ):
@@ -40,7 +74,10 @@ class ForecastResult:
 
 
 def get_price_data(
-    db_path: str, product_name: str, currency: str = "HTG"
+    db_path: str,
+    product_name: str,
+    currency: str = "HTG",
+    con: Optional[duckdb.DuckDBPyConnection] = None,
 ) -> pd.DataFrame:
     """
     Query historical price data for a given product from the database.
@@ -49,31 +86,33 @@ def get_price_data(
         db_path: Path to DuckDB database
         product_name: Name of the product/commodity
         currency: Currency for prices ('HTG' or 'USD')
+        con: Open connection to read through instead of opening db_path
+            (e.g. the sync's writer connection)
 
     Returns:
         DataFrame with columns: date, market, price, market_name
     """
-    conn = duckdb.connect(db_path, read_only=True)
+    conn = con or duckdb.connect(db_path, read_only=True)
 
     # Determine price column based on currency
     price_col = "value" if currency == "HTG" else "common_currency_price"
 
+    # price_observations_wide is pre-joined at sync time (no dimension joins)
     query = f"""
     SELECT 
-        po.period_date as date,
-        m.id as market,
-        m.name as market_name,
-        po.{price_col} as price
-    FROM price_observations po
-    JOIN products p ON po.product_id = p.id
-    JOIN markets m ON po.market_id = m.id
-    WHERE p.name = ?
-    AND po.{price_col} IS NOT NULL
-    ORDER BY m.name, po.period_date
+        period_date as date,
+        market_id as market,
+        market as market_name,
+        {price_col} as price
+    FROM price_observations_wide
+    WHERE product = ?
+    AND {price_col} IS NOT NULL
+    ORDER BY market, period_date
     """
 
     df = conn.execute(query, [product_name]).fetchdf()
-    conn.close()
+    if con is None:
+        conn.close()
 
     # Convert date to datetime
     df["date"] = pd.to_datetime(df["date"])
@@ -155,6 +194,8 @@ def fit_prophet_model(df: pd.DataFrame, market_name: str) -> ForecastResult:
     Returns:
         ForecastResult object with model and metadata
     """
+    from prophet import Prophet
+
     try:
         # Prepare data
         prophet_df = prepare_prophet_data(df, market_name)
@@ -186,12 +227,12 @@ def fit_prophet_model(df: pd.DataFrame, market_name: str) -> ForecastResult:
         )
 
 
-def generate_forecast(model: Prophet, periods: int = 8) -> pd.DataFrame:
+def generate_forecast(model: "Prophet", periods: int = 8) -> pd.DataFrame:
     """
     Generate future forecasts using a fitted Prophet model.
 
     Args:
-        model: Fitted Prophet model
+        model: Fitted Prophet model (or BaselineModel)
         periods: Number of months to forecast
 
     Returns:
@@ -219,6 +260,8 @@ def fit_market_average_model(
     Returns:
         ForecastResult object for market average
     """
+    from prophet import Prophet
+
     try:
         # Filter to available markets only
         avg_df = df[df["market_name"].isin(available_markets)].copy()
@@ -254,23 +297,433 @@ def fit_market_average_model(
         )
 
 
+def _month_index(dates) -> np.ndarray:
+    """Months since year 0 of each date, so consecutive months differ by 1."""
+    dates = pd.DatetimeIndex(dates)
+    return dates.year.to_numpy() * 12 + dates.month.to_numpy() - 1
+
+
+def _baseline_design(months: np.ndarray, origin: int) -> np.ndarray:
+    """
+    Design matrix of the fast baseline.
+
+    Args:
+        months: Month indexes (from _month_index)
+        origin: Month index where the trend term is zero
+
+    Returns:
+        Array with one row per month: intercept, trend in years since origin,
+        and 11 month dummies (January is the reference month)
+    """
+    X = np.zeros((len(months), 13))
+    X[:, 0] = 1.0
+    X[:, 1] = (months - origin) / 12
+    calendar = months % 12
+    rows = np.nonzero(calendar)[0]
+    X[rows, 1 + calendar[rows]] = 1.0
+    return X
+
+
+class BaselineModel:
+    """
+    Fast baseline for one series, fitted by fit_baseline_models.
+
+    Log price is a linear trend plus a monthly seasonal effect over the
+    history. Forecasts do not extrapolate the trend: they hold the last
+    observed deseasonalized level and add the seasonal effect of each month
+    (a seasonal random walk), with intervals that widen with the horizon.
+
+    The class offers the parts of the Prophet API used here: history,
+    make_future_dataframe() and predict(). Like a Prophet forecast with
+    multiplicative seasonality, predict() returns the columns ds, trend,
+    yearly, yhat_lower, yhat_upper and yhat.
+    """
+
+    def __init__(
+        self,
+        history: pd.DataFrame,
+        coef: np.ndarray,
+        origin: int,
+        sigma: float,
+        step_sigma: float,
+    ):
+        """
+        Args:
+            history: Data the model was fitted on (ds, y)
+            coef: Coefficients for the _baseline_design columns
+            origin: Month index of the last observation (trend term is zero there)
+            sigma: Residual standard deviation of log price
+            step_sigma: Standard deviation of monthly changes in the
+                deseasonalized log price
+        """
+        self.history = history
+        self.coef = coef
+        self.origin = origin
+        self.sigma = sigma
+        self.step_sigma = step_sigma
+
+        # Deseasonalized level of the last observation, held in forecasts
+        last = _baseline_design(np.array([origin]), origin)[0]
+        self.level = np.log(history["y"].iloc[-1]) - last[2:] @ coef[2:]
+
+    def make_future_dataframe(
+        self, periods: int, freq: str = "MS", include_history: bool = True
+    ) -> pd.DataFrame:
+        """Dates to predict: the history dates and `periods` dates after them."""
+        last_date = self.history["ds"].max()
+        dates = pd.date_range(start=last_date, periods=periods + 1, freq=freq)
+        dates = dates[dates > last_date][:periods]
+        if include_history:
+            dates = pd.DatetimeIndex(self.history["ds"]).append(dates)
+        return pd.DataFrame({"ds": dates})
+
+    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Predict prices with 95% intervals for the dates in df['ds']."""
+        ds = pd.to_datetime(df["ds"]).reset_index(drop=True)
+        months = _month_index(ds)
+        X = _baseline_design(months, self.origin)
+        season = X[:, 2:] @ self.coef[2:]
+
+        # Fitted trend over the history, the last level after it
+        ahead = months - self.origin
+        future = ahead > 0
+        trend = np.where(future, self.level, X[:, :2] @ self.coef[:2])
+        spread = INTERVAL_Z * np.where(
+            future,
+            self.step_sigma * np.sqrt(np.maximum(ahead, 1)),
+            self.sigma,
+        )
+        mean = trend + season
+
+        return pd.DataFrame(
+            {
+                "ds": ds,
+                "trend": np.exp(trend),
+                "yearly": np.exp(season) - 1,
+                "yhat_lower": np.exp(mean - spread),
+                "yhat_upper": np.exp(mean + spread),
+                "yhat": np.exp(mean),
+            }
+        )
+
+
+def fit_baseline_models(frames: Dict[str, pd.DataFrame]) -> Dict[str, ForecastResult]:
+    """
+    Fit the fast baseline to all series of a commodity at once.
+
+    The series are laid out as rows of a 2-D array of log prices over a
+    shared monthly grid, and the weighted least-squares fits of all rows are
+    solved together. Each row uses its last BASELINE_WINDOW_MONTHS months.
+
+    Args:
+        frames: Frames from model_frames()
+
+    Returns:
+        Dictionary of ForecastResult objects with BaselineModel models, in
+        the order of frames
+    """
+    if not frames:
+        return {}
+
+    names = list(frames)
+    histories = [prepare_prophet_data(frames[name], name) for name in names]
+    months = [_month_index(history["ds"]) for history in histories]
+    start = min(month.min() for month in months)
+    end = max(month.max() for month in months)
+
+    # One row per series, one column per month (NaN where not observed)
+    Y = np.full((len(names), end - start + 1), np.nan)
+    for row, (history, month) in enumerate(zip(histories, months)):
+        Y[row, month - start] = history["y"].to_numpy()
+    last = np.array([month.max() for month in months])
+    grid = np.arange(start, end + 1)
+    recent = grid > (last - BASELINE_WINDOW_MONTHS)[:, None]
+    observed = np.isfinite(Y) & (Y > 0)
+    W = (observed & recent).astype(float)
+    log_y = np.log(np.where(observed, Y, 1.0))
+
+    # Batched weighted normal equations; the ridge on the month dummies keeps
+    # months never observed in the window at no seasonal effect. The trend
+    # term is centred on the series' own last month.
+    X = np.stack([_baseline_design(grid, origin) for origin in last])
+    ridge = np.diag([0.0, 0.0] + [BASELINE_RIDGE] * (X.shape[2] - 2))
+    A = np.einsum("itp,it,itq->ipq", X, W, X) + ridge
+    b = np.einsum("itp,it,it->ip", X, W, log_y)
+    n = W.sum(axis=1)
+    ok = n >= BASELINE_MIN_OBSERVATIONS
+
+    coef = np.zeros(b.shape)
+    if ok.any():
+        coef[ok] = np.linalg.solve(A[ok], b[ok][..., None])[..., 0]
+    residuals = (log_y - np.einsum("itp,ip->it", X, coef)) * W
+    sigma = np.sqrt((residuals**2).sum(axis=1) / np.maximum(n - X.shape[2], 1))
+
+    # Month-to-month changes of the deseasonalized series, for forecast spread
+    deseasonalized = log_y - np.einsum("itp,ip->it", X[:, :, 2:], coef[:, 2:])
+    steps = np.diff(deseasonalized, axis=1) * W[:, 1:] * W[:, :-1]
+    n_steps = (W[:, 1:] * W[:, :-1]).sum(axis=1)
+    step_sigma = np.sqrt((steps**2).sum(axis=1) / np.maximum(n_steps - 1, 1))
+
+    results = {}
+    for row, name in enumerate(names):
+        if ok[row]:
+            model = BaselineModel(
+                histories[row], coef[row], last[row], sigma[row], step_sigma[row]
+            )
+            results[name] = ForecastResult(
+                market_name=name,
+                success=True,
+                model=model,
+                n_observations=len(histories[row]),
+            )
+        else:
+            results[name] = ForecastResult(
+                market_name=name,
+                success=False,
+                error=f"Only {int(n[row])} observations in the last "
+                f"{BASELINE_WINDOW_MONTHS} months",
+                n_observations=len(histories[row]),
+            )
+    return results
+
+
+def _get_fit_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, (re)creating it for a new worker count."""
+    global _fit_pool, _fit_pool_workers
+
+    if _fit_pool is None or _fit_pool_workers != workers:
+        _reset_fit_pool()
+        # spawn: forking the (multi-threaded) Streamlit server is not safe
+        _fit_pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _fit_pool_workers = workers
+    return _fit_pool
+
+
+def _reset_fit_pool():
+    """Shut down the shared process pool; the next parallel fit starts a new one."""
+    global _fit_pool, _fit_pool_workers
+
+    if _fit_pool is not None:
+        _fit_pool.shutdown(wait=False)
+    _fit_pool = None
+    _fit_pool_workers = 0
+
+
+def _fit_frame(df: pd.DataFrame, market_name: str) -> ForecastResult:
+    """Fit one model on the frame model_frames() built for it."""
+    if market_name == "Market Average":
+        return fit_market_average_model(df, [market_name])
+    return fit_prophet_model(df, market_name)
+
+
+def _fit_in_worker(
+    df: pd.DataFrame, market_name: str
+) -> Tuple[ForecastResult, Optional[str]]:
+    """
+    Fit one model in a pool worker and return it with the model as JSON.
+
+    Args:
+        df: Price data for this model only
+        market_name: Name of the market (or 'Market Average')
+
+    Returns:
+        Tuple of (ForecastResult without its model, serialized model or None)
+    """
+    from prophet.serialize import model_to_json
+
+    result = _fit_frame(df, market_name)
+
+    # Fitted models are sent back with Prophet's own serializer
+    model_json = model_to_json(result.model) if result.model is not None else None
+    result.model = None
+    return result, model_json
+
+
+def model_frames(
+    df: pd.DataFrame, available_markets: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Split price data into the frame each model is fitted on.
+
+    Args:
+        df: DataFrame with price data
+        available_markets: List of markets with sufficient data
+
+    Returns:
+        Dictionary mapping each market, then 'Market Average', to its data
+    """
+    if not available_markets:
+        return {}
+
+    columns = ["date", "price", "market_name"]
+    frames = {
+        market_name: df.loc[df["market_name"] == market_name, columns]
+        for market_name in available_markets
+    }
+
+    # Average here so the average model gets one series, not every market
+    frames["Market Average"] = (
+        df[df["market_name"].isin(available_markets)]
+        .groupby("date", as_index=False)["price"]
+        .mean()
+        .assign(market_name="Market Average")
+    )
+    return frames
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Fingerprint the data a model is fitted on.
+
+    Args:
+        df: Frame from model_frames()
+
+    Returns:
+        String of the latest date, the row count and a hash of the dates and
+        prices (so revised prices also change it)
+    """
+    content = pd.util.hash_pandas_object(df[["date", "price"]], index=False).sum()
+    return f"{df['date'].max():%Y-%m-%d}:{len(df)}:{content:x}"
+
+
+def _cache_path(
+    product_name: str, currency: str, market_name: str, fingerprint: str
+) -> Path:
+    """Cache file for one (product, currency, market, fingerprint) key."""
+    key = json.dumps([product_name, currency, market_name, fingerprint])
+    return MODEL_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def load_cached_model(path: Path) -> Optional[ForecastResult]:
+    """
+    Load a fitted model from the cache, marking it as recently used.
+
+    Args:
+        path: Cache file from _cache_path()
+
+    Returns:
+        ForecastResult with the model, or None if it is not cached
+    """
+    from prophet.serialize import model_from_json
+
+    try:
+        entry = json.loads(path.read_text())
+        model = model_from_json(entry["model"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Unreadable entry (e.g. written by another Prophet version): refit
+        print(f"[WARN] Discarding cached model {path.name}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+    # The file's mtime is its last use, for LRU eviction
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+    return ForecastResult(
+        market_name=entry["market_name"],
+        success=True,
+        model=model,
+        n_observations=entry["n_observations"],
+    )
+
+
+def save_cached_model(path: Path, result: ForecastResult):
+    """
+    Write a fitted model to the cache.
+
+    Args:
+        path: Cache file from _cache_path()
+        result: Successful ForecastResult
+    """
+    from prophet.serialize import model_to_json
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "market_name": result.market_name,
+        "n_observations": result.n_observations,
+        "model": model_to_json(result.model),
+    }
+    # Write then rename, so concurrent sessions never read a partial file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(entry))
+    os.replace(tmp_path, path)
+
+
+def evict_model_cache(max_bytes: int = MODEL_CACHE_MAX_BYTES) -> int:
+    """
+    Delete least recently used models until the cache fits in max_bytes.
+
+    Args:
+        max_bytes: Size limit for the cache directory
+
+    Returns:
+        Number of cached models deleted
+    """
+    entries = []
+    for path in MODEL_CACHE_DIR.glob("*.json"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        deleted += 1
+    return deleted
+
+
 def fit_all_models(
-    db_path: str, product_name: str, currency: str = "HTG", min_months: int = 24
+    db_path: str,
+    product_name: str,
+    currency: str = "HTG",
+    min_months: int = 24,
+    workers: Optional[int] = None,
+    refit: bool = False,
+    con: Optional[duckdb.DuckDBPyConnection] = None,
+    backend: str = "prophet",
 ) -> Tuple[Dict[str, ForecastResult], Dict[str, Dict]]:
     """
-    Fit Prophet models for all markets with sufficient data, plus market average.
+    Fit forecast models for all markets with sufficient data, plus market average.
+
+    With backend='fast' all series are fitted at once by fit_baseline_models,
+    in milliseconds and without importing Prophet.
+
+    Fitted Prophet models are cached on disk (MODEL_CACHE_DIR), keyed by
+    product, currency, market and data_fingerprint(), so a model is only refit
+    when its data changed. Models that need fitting run in parallel on a
+    process pool when more than one worker is used; each worker receives only
+    the rows of the model it fits.
 
     Args:
         db_path: Path to DuckDB database
         product_name: Name of the product/commodity
         currency: Currency for prices ('HTG' or 'USD')
         min_months: Minimum months of data required
+        workers: Processes to fit with (default: FIT_WORKERS, 1 = sequential)
+        refit: Ignore cached models and fit every model again
+        con: Open connection to read the price data through (see get_price_data)
+        backend: 'prophet' or 'fast' (see BACKENDS)
 
     Returns:
         Tuple of (results_dict, availability_dict)
     """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown forecasting backend: {backend}")
+
     # Get price data
-    df = get_price_data(db_path, product_name, currency)
+    df = get_price_data(db_path, product_name, currency, con=con)
 
     if len(df) == 0:
         return {}, {}
@@ -280,22 +733,86 @@ def fit_all_models(
 
     # Get markets with sufficient data
     available_markets = [m for m, info in availability.items() if info["sufficient"]]
+    frames = model_frames(df, available_markets)
 
-    results = {}
+    if backend == "fast":
+        # No cache or process pool: fitting every series takes milliseconds
+        return fit_baseline_models(frames), availability
 
-    # Fit individual market models
-    for market_name in available_markets:
-        result = fit_prophet_model(df, market_name)
-        results[market_name] = result
+    # Reuse cached models whose data has not changed
+    cache_paths = {
+        market_name: _cache_path(product_name, currency, market_name, data_fingerprint(frame))
+        for market_name, frame in frames.items()
+    }
+    results = {}
+    if not refit:
+        for market_name, path in cache_paths.items():
+            cached = load_cached_model(path)
+            if cached is not None:
+                results[market_name] = cached
+
+    to_fit = {name: frame for name, frame in frames.items() if name not in results}
+    fitted = {}
+    workers = min(workers or FIT_WORKERS, len(to_fit))
+
+    if workers > 1:
+        try:
+            fitted = _fit_models_parallel(to_fit, workers)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory): drop the pool and fit here
+            print(f"[WARN] Parallel fitting failed ({e}), fitting sequentially")
+            _reset_fit_pool()
+            fitted = {}
+
+    if not fitted:
+        fitted = {name: _fit_frame(frame, name) for name, frame in to_fit.items()}
+
+    for market_name, result in fitted.items():
+        if result.success and result.model is not None:
+            try:
+                save_cached_model(cache_paths[market_name], result)
+            except OSError as e:
+                print(f"[WARN] Could not cache model for {market_name}: {e}")
+    if fitted:
+        evict_model_cache()
 
-    # Fit market average model if we have at least one market
-    if available_markets:
-        avg_result = fit_market_average_model(df, available_markets)
-        results["Market Average"] = avg_result
+    # Same order as the frames: markets, then the market average
+    results.update(fitted)
+    results = {market_name: results[market_name] for market_name in frames}
 
     return results, availability
 
 
+def _fit_models_parallel(
+    frames: Dict[str, pd.DataFrame], workers: int
+) -> Dict[str, ForecastResult]:
+    """
+    Fit one model per frame on the process pool.
+
+    Args:
+        frames: Frames from model_frames() that need fitting
+        workers: Number of worker processes
+
+    Returns:
+        Dictionary of ForecastResult objects, in the order of frames
+    """
+    from prophet.serialize import model_from_json
+
+    pool = _get_fit_pool(workers)
+    futures = {
+        market_name: pool.submit(_fit_in_worker, frame, market_name)
+        for market_name, frame in frames.items()
+    }
+
+    results = {}
+    for market_name, future in futures.items():
+        result, model_json = future.result()
+        if model_json is not None:
+            result.model = model_from_json(model_json)
+        results[market_name] = result
+    return results
+
+
 def generate_all_forecasts(
     results: Dict[str, ForecastResult], periods: int = 8
 ) -> Dict[str, pd.DataFrame]:
@@ -321,3 +838,66 @@ def generate_all_forecasts(
                 print(f"Error generating forecast for {market_name}: {e}")
 
     return forecasts
+
+
+def forecast_tables(
+    results: Dict[str, ForecastResult],
+    availability: Dict[str, Dict],
+    forecasts: Dict[str, pd.DataFrame],
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Flatten fitted models and their forecasts into rows for the database.
+
+    Args:
+        results: Dictionary of ForecastResult objects (from fit_all_models)
+        availability: Data availability per market (from fit_all_models)
+        forecasts: Forecast DataFrames (from generate_all_forecasts)
+
+    Returns:
+        Tuple of (forecast_rows, model_rows) matching the forecasts and
+        forecast_models tables, without the product and currency columns
+    """
+    frames = []
+    for market_name, forecast in forecasts.items():
+        last_observed = results[market_name].model.history["ds"].max()
+        frames.append(
+            pd.DataFrame(
+                {
+                    "market": market_name,
+                    "ds": forecast["ds"].dt.date,
+                    "is_forecast": forecast["ds"] > last_observed,
+                    "yhat": forecast["yhat"],
+                    "yhat_lower": forecast["yhat_lower"],
+                    "yhat_upper": forecast["yhat_upper"],
+                    "trend": forecast["trend"],
+                    # Only present when Prophet enabled yearly seasonality
+                    "yearly": forecast["yearly"] if "yearly" in forecast else None,
+                }
+            )
+        )
+    forecast_rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    model_rows = []
+    statuses = dict(availability)
+    if "Market Average" in results:
+        statuses["Market Average"] = {
+            "n_observations": results["Market Average"].n_observations,
+            "months_span": None,
+            "sufficient": True,
+            "reason": None,
+        }
+    for market_name, info in statuses.items():
+        result = results.get(market_name)
+        model_rows.append(
+            {
+                "market": market_name,
+                "n_observations": info["n_observations"],
+                "months_span": info["months_span"],
+                "sufficient": info["sufficient"],
+                "reason": info["reason"],
+                "success": result.success if result else None,
+                "error": result.error if result else None,
+            }
+        )
+
+    return forecast_rows, pd.DataFrame(model_rows)
@@ -9,18 +9,105 @@ This module provides the FEWSDatabase class for:
 - Upserting dimension tables (markets, products, units, sources)
 - Syncing price observations from the API
 - Tracking import history
+- Deriving unit conversion factors for per-kg (or per-litre) prices
+- Coordinating writers with a lock file and staged, atomically swapped writes
 """
 
+import json
+import os
+import re
+import shutil
+import socket
+import time
+from contextlib import contextmanager
+
 import duckdb
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 # Default database path
 DEFAULT_DB_PATH = Path(__file__).parent / "fews_haiti.duckdb"
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# API columns read by sync_dataframe (pass to FEWSNETClient as a projection)
+SYNC_COLUMNS = [
+    "market_id", "fnid", "market", "admin_1", "admin_2", "country_code",
+    "latitude", "longitude", "product", "cpcv2", "cpcv2_description",
+    "product_source", "is_staple_food", "unit", "unit_type", "common_unit",
+    "datasourceorganization", "source_organization", "source_document",
+    "period_date", "start_date", "price_type", "currency", "value",
+    "exchange_rate", "common_unit_price", "common_currency_price",
+    "collection_status", "dataseries", "modified",
+]
+
+# Secondary indexes on price_observations, kept only in the 'indexed' layout.
+# The 'clustered' layout drops them and relies on DuckDB zonemaps over rows
+# sorted by CLUSTER_KEY instead (see FEWSDatabase.recluster).
+SECONDARY_INDEXES = {
+    "idx_price_obs_date": "price_observations(period_date)",
+    "idx_price_obs_market": "price_observations(market_id)",
+    "idx_price_obs_product": "price_observations(product_id)",
+    "idx_price_obs_market_product": "price_observations(market_id, product_id)",
+}
+LAYOUTS = ("indexed", "clustered")
+CLUSTER_KEY = "product_id, market_id, period_date"
+
+# Tables rebuilt by refresh_aggregates, tracked by name in aggregate_state
+MATERIALIZED_TABLES = ["agg_monthly", "latest_observations", "price_observations_wide"]
+
+# Unit name suffixes: common unit and size of one suffix unit in it
+UNIT_SCALES = {
+    "g": ("kg", 0.001),
+    "gr": ("kg", 0.001),
+    "kg": ("kg", 1.0),
+    "lb": ("kg", 0.45359237),
+    "lbs": ("kg", 0.45359237),
+    "oz": ("kg", 0.028349523125),
+    "mt": ("kg", 1000.0),
+    "ml": ("L", 0.001),
+    "cl": ("L", 0.01),
+    "l": ("L", 1.0),
+    "gal": ("L", 3.785411784),
+    "gallon": ("L", 3.785411784),
+}
+# e.g. 6_lb, 175_g, 1.5_kg, 1_L, kg
+UNIT_PATTERN = re.compile(r"^(?:(\d+(?:\.\d+)?)_?)?([a-z]+)$")
+
+
+def _same_value(stored, incoming) -> bool:
+    """Compare a stored column value with an incoming API value (NULL/NaN equal)."""
+    if pd.isna(stored) and pd.isna(incoming):
+        return True
+    if pd.isna(stored) or pd.isna(incoming):
+        return False
+    try:
+        return bool(stored == incoming)
+    except TypeError:
+        return False
+
+
+def parse_unit(name: Optional[str]) -> Optional[tuple]:
+    """
+    Derive the common unit and conversion factor from a FEWS NET unit name.
+
+    Args:
+        name: Unit name, e.g. '6_lb', '175_g' or 'kg'
+
+    Returns:
+        (common_unit, conversion_factor) such as ('kg', 2.72155422), or None
+        for names that are not a quantity of a known unit (e.g. 'marmite')
+    """
+    if not isinstance(name, str):
+        return None
+    match = UNIT_PATTERN.match(name.strip().lower())
+    if not match or match.group(2) not in UNIT_SCALES:
+        return None
+    common_unit, scale = UNIT_SCALES[match.group(2)]
+    quantity = float(match.group(1)) if match.group(1) else 1.0
+    return common_unit, quantity * scale
+
 
 class FEWSDatabase:
     """Database manager for FEWS NET Haiti price data."""
@@ -34,6 +121,38 @@ class FEWSDatabase:
         """
         self.db_path = db_path or DEFAULT_DB_PATH
         self.con = None
+        self._dim_keys = None
+
+    def _dimension_keys(self) -> dict:
+        """
+        Return the dimension-key cache, loading it from the database on first use.
+
+        Maps natural keys to internal IDs for each dimension table:
+        markets by fews_id, products by (name, product_source), units by name
+        and data_sources by fews_id.
+        """
+        if self._dim_keys is None:
+            self._dim_keys = {
+                "markets": dict(self.con.execute(
+                    "SELECT fews_id, id FROM markets"
+                ).fetchall()),
+                # Legacy databases can hold duplicate (name, NULL) products;
+                # the oldest id wins, as in bulk_sync_dataframe
+                "products": {
+                    (name, source): id_
+                    for name, source, id_ in self.con.execute(
+                        "SELECT name, product_source, MIN(id) FROM products "
+                        "GROUP BY name, product_source"
+                    ).fetchall()
+                },
+                "units": dict(self.con.execute(
+                    "SELECT name, id FROM units"
+                ).fetchall()),
+                "sources": dict(self.con.execute(
+                    "SELECT fews_id, id FROM data_sources WHERE fews_id IS NOT NULL"
+                ).fetchall()),
+            }
+        return self._dim_keys
 
     def connect(self):
         """Open database connection."""
@@ -45,6 +164,7 @@ class FEWSDatabase:
         if self.con:
             self.con.close()
             self.con = None
+        self._dim_keys = None
 
     def __enter__(self):
         return self.connect()
@@ -52,28 +172,94 @@ class FEWSDatabase:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def create_tables(self):
-        """Create all tables from schema.sql."""
+    def create_tables(self, layout: Optional[str] = None):
+        """
+        Create all tables from schema.sql and apply the storage layout.
+
+        Layouts for price_observations:
+            indexed: secondary ART indexes on date, market and product (default)
+            clustered: no secondary indexes; rows kept sorted by CLUSTER_KEY
+                so scans for one commodity skip most row groups via zonemaps,
+                and row-path inserts maintain fewer indexes
+
+        The layout is stored in db_settings, so later calls without a layout
+        keep it. Switching to clustered reclusters the table once; rows added
+        by later syncs are appended unsorted until the next recluster().
+
+        Args:
+            layout: 'indexed' or 'clustered'; None keeps the stored layout
+        """
         if not SCHEMA_PATH.exists():
             raise FileNotFoundError(f"Schema file not found: {SCHEMA_PATH}")
+        if layout is not None and layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}, expected one of {LAYOUTS}")
 
         schema_sql = SCHEMA_PATH.read_text()
 
         # DuckDB can execute multiple statements
         self.con.execute(schema_sql)
-        print(f"[OK] Database schema created: {self.db_path}")
+
+        row = self.con.execute("SELECT value FROM db_settings WHERE name = 'layout'").fetchone()
+        stored = row[0] if row else None
+        layout = layout or stored or "indexed"
+
+        for name, target in SECONDARY_INDEXES.items():
+            if layout == "indexed":
+                self.con.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            else:
+                self.con.execute(f"DROP INDEX IF EXISTS {name}")
+
+        if layout != stored:
+            self.con.execute("""
+                INSERT INTO db_settings (name, value) VALUES ('layout', ?)
+                ON CONFLICT (name) DO UPDATE SET value = EXCLUDED.value
+            """, [layout])
+            if layout == "clustered":
+                self.recluster()
+        print(f"[OK] Database schema created: {self.db_path} (layout: {layout})")
+
+    def recluster(self):
+        """
+        Rewrite price_observations sorted by CLUSTER_KEY.
+
+        Rows appended by syncs land at the end of the table in arrival order,
+        which widens each row group's min/max (zonemap) ranges. Rewriting the
+        table in (product_id, market_id, period_date) order restores tight
+        ranges, so filters on a product prune most row groups. Runs in one
+        transaction and checkpoints afterwards to write the compacted table.
+        """
+        start = time.perf_counter()
+        self.con.begin()
+        try:
+            self.con.execute("""
+                CREATE OR REPLACE TEMP TABLE recluster_rows AS
+                SELECT * FROM price_observations
+            """)
+            self.con.execute("DELETE FROM price_observations")
+            self.con.execute(f"""
+                INSERT INTO price_observations
+                SELECT * FROM recluster_rows ORDER BY {CLUSTER_KEY}
+            """)
+            count = self.con.execute("SELECT COUNT(*) FROM recluster_rows").fetchone()[0]
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+        finally:
+            self.con.execute("DROP TABLE IF EXISTS recluster_rows")
+
+        self.con.execute("CHECKPOINT")
+        print(f"[OK] Reclustered {count} observations by ({CLUSTER_KEY}) "
+              f"in {time.perf_counter() - start:.2f}s")
 
     def get_or_create_market(self, row: dict) -> int:
         """Get or create a market record, returning the internal ID."""
         fews_id = row.get("market_id")
+        cache = self._dimension_keys()["markets"]
+        key = None if pd.isna(fews_id) else int(fews_id)
 
-        # Check if exists
-        result = self.con.execute(
-            "SELECT id FROM markets WHERE fews_id = ?", [fews_id]
-        ).fetchone()
-
-        if result:
-            return result[0]
+        if key in cache:
+            return cache[key]
 
         # Insert new market
         self.con.execute("""
@@ -94,23 +280,20 @@ class FEWSDatabase:
         result = self.con.execute(
             "SELECT id FROM markets WHERE fews_id = ?", [fews_id]
         ).fetchone()
+        cache[key] = result[0]
         return result[0]
 
     def get_or_create_product(self, row: dict) -> int:
         """Get or create a product record, returning the internal ID."""
         name = row.get("product")
         source = row.get("product_source")
+        cache = self._dimension_keys()["products"]
+        key = (name, None if pd.isna(source) else source)
 
-        # Check if exists
-        result = self.con.execute(
-            "SELECT id FROM products WHERE name = ? AND product_source = ?",
-            [name, source]
-        ).fetchone()
+        if key in cache:
+            return cache[key]
 
-        if result:
-            return result[0]
-
-        # Insert new product
+        # Insert new product (a missing source is stored as NULL, matching the key)
         self.con.execute("""
             INSERT INTO products (name, cpcv2, cpcv2_description, product_source, is_staple_food)
             VALUES (?, ?, ?, ?, ?)
@@ -118,27 +301,26 @@ class FEWSDatabase:
             name,
             row.get("cpcv2"),
             row.get("cpcv2_description"),
-            source,
+            key[1],
             row.get("is_staple_food", False),
         ])
 
-        result = self.con.execute(
-            "SELECT id FROM products WHERE name = ? AND product_source = ?",
-            [name, source]
-        ).fetchone()
-        return result[0]
+        product_id = self.con.execute(
+            "SELECT MIN(id) FROM products WHERE name = ? AND product_source IS NOT DISTINCT FROM ?",
+            [name, key[1]]
+        ).fetchone()[0]
+        if product_id is None:
+            raise ValueError(f"Product {name!r} (source {key[1]!r}) not found after insert")
+        cache[key] = product_id
+        return product_id
 
     def get_or_create_unit(self, row: dict) -> int:
         """Get or create a unit record, returning the internal ID."""
         name = row.get("unit")
+        cache = self._dimension_keys()["units"]
 
-        # Check if exists
-        result = self.con.execute(
-            "SELECT id FROM units WHERE name = ?", [name]
-        ).fetchone()
-
-        if result:
-            return result[0]
+        if name in cache:
+            return cache[name]
 
         # Insert new unit
         self.con.execute("""
@@ -153,6 +335,7 @@ class FEWSDatabase:
         result = self.con.execute(
             "SELECT id FROM units WHERE name = ?", [name]
         ).fetchone()
+        cache[name] = result[0]
         return result[0]
 
     def get_or_create_source(self, row: dict) -> Optional[int]:
@@ -162,14 +345,10 @@ class FEWSDatabase:
             return None
 
         fews_id = int(fews_id)
+        cache = self._dimension_keys()["sources"]
 
-        # Check if exists
-        result = self.con.execute(
-            "SELECT id FROM data_sources WHERE fews_id = ?", [fews_id]
-        ).fetchone()
-
-        if result:
-            return result[0]
+        if fews_id in cache:
+            return cache[fews_id]
 
         # Insert new source
         self.con.execute("""
@@ -184,36 +363,58 @@ class FEWSDatabase:
         result = self.con.execute(
             "SELECT id FROM data_sources WHERE fews_id = ?", [fews_id]
         ).fetchone()
+        cache[fews_id] = result[0]
         return result[0]
 
     def upsert_price_observation(self, row: dict, market_id: int, product_id: int,
-                                  unit_id: int, source_id: Optional[int]) -> bool:
+                                  unit_id: int, source_id: Optional[int]) -> str:
         """
         Insert or update a price observation.
 
-        Returns True if inserted, False if skipped (duplicate).
+        An existing record whose api_modified_at and value columns already
+        match the incoming row is left untouched. Rows without a value (e.g.
+        collection_status 'No Data') are not stored.
+
+        Returns 'inserted', 'updated' or 'skipped' (unchanged or no value).
         """
+        value = row.get("value")
+        if value is None or pd.isna(value):
+            return "skipped"
+
         period_date = row.get("period_date")
         price_type = row.get("price_type", "Retail")
 
         # Check if exists
         result = self.con.execute("""
-            SELECT id FROM price_observations
+            SELECT id, api_modified_at, value, exchange_rate, common_unit_price,
+                   common_currency_price, collection_status
+            FROM price_observations
             WHERE market_id = ? AND product_id = ? AND unit_id = ?
               AND period_date = ? AND price_type = ?
         """, [market_id, product_id, unit_id, period_date, price_type]).fetchone()
 
-        # Parse modified timestamp
+        # Parse modified timestamp (already parsed if the client applied PRICE_DTYPES)
         api_modified = row.get("modified")
-        if api_modified and not pd.isna(api_modified):
+        if api_modified is None or pd.isna(api_modified):
+            api_modified = None
+        elif not isinstance(api_modified, pd.Timestamp):
             try:
                 api_modified = pd.to_datetime(api_modified)
             except Exception:
                 api_modified = None
-        else:
-            api_modified = None
 
         if result:
+            incoming = [
+                api_modified,
+                row.get("value"),
+                row.get("exchange_rate"),
+                row.get("common_unit_price"),
+                row.get("common_currency_price"),
+                row.get("collection_status"),
+            ]
+            if all(_same_value(old, new) for old, new in zip(result[1:], incoming)):
+                return "skipped"
+
             # Update existing record
             self.con.execute("""
                 UPDATE price_observations SET
@@ -234,7 +435,7 @@ class FEWSDatabase:
                 api_modified,
                 result[0],
             ])
-            return False  # Updated, not inserted
+            return "updated"
 
         # Insert new record
         self.con.execute("""
@@ -261,56 +462,499 @@ class FEWSDatabase:
             row.get("dataseries"),
             api_modified,
         ])
-        return True  # Inserted
+        return "inserted"
 
-    def sync_dataframe(self, df: pd.DataFrame) -> dict:
+    def sync_row(self, row: dict) -> str:
+        """
+        Resolve dimensions for a single API row and upsert its price observation.
+
+        Returns 'inserted', 'updated' or 'skipped' (see upsert_price_observation).
+        """
+        # Get or create dimension records
+        market_id = self.get_or_create_market(row)
+        product_id = self.get_or_create_product(row)
+        unit_id = self.get_or_create_unit(row)
+        source_id = self.get_or_create_source(row)
+
+        # Upsert price observation
+        return self.upsert_price_observation(
+            row, market_id, product_id, unit_id, source_id
+        )
+
+    def sync_dataframe(self, df: pd.DataFrame, bulk: bool = False,
+                       batch_size: Optional[int] = None) -> dict:
         """
         Sync a DataFrame of price data to the database.
 
         Args:
             df: DataFrame with FEWS NET API data
+            bulk: Use the set-based ingest path (see bulk_sync_dataframe)
+            batch_size: If set, commit every batch_size rows in an explicit
+                transaction (see sync_dataframe_batched)
 
         Returns:
             dict with counts: {'inserted': n, 'updated': n, 'skipped': n}
         """
+        if batch_size:
+            return self.sync_dataframe_batched(df, batch_size, bulk=bulk)
+        if bulk:
+            return self.bulk_sync_dataframe(df)
+
         stats = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
 
         for idx, row in df.iterrows():
             try:
-                row_dict = row.to_dict()
+                stats[self.sync_row(row.to_dict())] += 1
+
+            except Exception as e:
+                stats["errors"] += 1
+                if stats["errors"] <= 5:  # Only print first 5 errors
+                    print(f"[WARN] Error processing row {idx}: {e}")
 
-                # Get or create dimension records
-                market_id = self.get_or_create_market(row_dict)
-                product_id = self.get_or_create_product(row_dict)
-                unit_id = self.get_or_create_unit(row_dict)
-                source_id = self.get_or_create_source(row_dict)
+        return stats
 
-                # Upsert price observation
-                inserted = self.upsert_price_observation(
-                    row_dict, market_id, product_id, unit_id, source_id
-                )
+    def sync_dataframe_batched(self, df: pd.DataFrame, batch_size: int,
+                               bulk: bool = False,
+                               checkpoint: Optional[Callable[[int], None]] = None) -> dict:
+        """
+        Sync a DataFrame in batches, one explicit transaction per batch.
+
+        If any row in a batch fails, the whole batch is rolled back, its rows
+        are counted as errors and syncing continues with the next batch.
+        Callers should log the import as 'partial' when failed_batches > 0.
+
+        Args:
+            df: DataFrame with FEWS NET API data
+            batch_size: Number of rows per transaction
+            bulk: Ingest each batch with bulk_sync_dataframe
+            checkpoint: Called after each committed batch with the number of
+                leading rows of df now stored. It is not called again after a
+                batch fails, so a checkpoint never skips rolled-back rows.
+
+        Returns:
+            dict with counts: {'inserted': n, 'updated': n, 'skipped': n,
+            'errors': n, 'failed_batches': n}
+        """
+        stats = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0,
+                 "failed_batches": 0}
+        n_batches = -(-len(df) // batch_size)
+        contiguous = True
+
+        for batch_num, offset in enumerate(range(0, len(df), batch_size), start=1):
+            batch = df.iloc[offset:offset + batch_size]
+            batch_start = time.perf_counter()
 
-                if inserted:
-                    stats["inserted"] += 1
+            try:
+                if bulk:
+                    # bulk_sync_dataframe manages its own transaction
+                    batch_stats = self.bulk_sync_dataframe(batch)
                 else:
-                    stats["updated"] += 1
+                    batch_stats = {"inserted": 0, "updated": 0, "skipped": 0}
+                    self.con.begin()
+                    try:
+                        for _, row in batch.iterrows():
+                            batch_stats[self.sync_row(row.to_dict())] += 1
+                        self.con.commit()
+                    except Exception:
+                        self.con.rollback()
+                        raise
+            except Exception as e:
+                # Dimension members inserted in this batch were rolled back too
+                self._dim_keys = None
+                stats["errors"] += len(batch)
+                stats["failed_batches"] += 1
+                contiguous = False
+                print(f"[WARN] Batch {batch_num}/{n_batches} rolled back "
+                      f"(rows {offset}-{offset + len(batch) - 1}): {e}")
+                continue
+
+            for key, count in batch_stats.items():
+                stats[key] = stats.get(key, 0) + count
+            if checkpoint and contiguous:
+                checkpoint(offset + len(batch))
+
+            elapsed = time.perf_counter() - batch_start
+            rate = len(batch) / elapsed if elapsed > 0 else float("inf")
+            print(f"[INFO] Batch {batch_num}/{n_batches}: {len(batch)} rows "
+                  f"in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+
+        return stats
 
+    def sync_batches(self, batches: Iterable[pd.DataFrame], bulk: bool = False,
+                     batch_size: Optional[int] = None) -> dict:
+        """
+        Sync an iterable of DataFrames (e.g. FEWSNETClient.iter_market_prices).
+
+        Each DataFrame is ingested with sync_dataframe as soon as it arrives.
+        If the iterable itself raises, batches already synced are kept and the
+        error is returned in stats['stream_error']. Errors raised while
+        ingesting a batch are not caught.
+
+        Args:
+            batches: Iterable of DataFrames with FEWS NET API data
+            bulk: Use the set-based ingest path for each DataFrame
+            batch_size: Rows per transaction within each DataFrame
+
+        Returns:
+            dict with summed sync_dataframe counts plus 'fetched'
+        """
+        stats = {"fetched": 0, "inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+
+        batches = iter(batches)
+        while True:
+            # Only errors from the stream itself mean a partial sync; database
+            # errors from sync_dataframe propagate to the caller
+            try:
+                df = next(batches)
+            except StopIteration:
+                break
             except Exception as e:
-                stats["errors"] += 1
-                if stats["errors"] <= 5:  # Only print first 5 errors
-                    print(f"[WARN] Error processing row {idx}: {e}")
+                stats["stream_error"] = str(e)
+                print(f"[WARN] Stream interrupted after {stats['fetched']} records: {e}")
+                break
+
+            stats["fetched"] += len(df)
+            for key, count in self.sync_dataframe(df, bulk=bulk, batch_size=batch_size).items():
+                stats[key] = stats.get(key, 0) + count
+
+        return stats
+
+    def bulk_sync_dataframe(self, df: pd.DataFrame) -> dict:
+        """
+        Sync a DataFrame of price data using set-based SQL.
+
+        The DataFrame is registered as a DuckDB relation, the four dimension
+        tables are resolved with INSERT ... ON CONFLICT, and price_observations
+        is merged with a single INSERT ... ON CONFLICT DO UPDATE, all in one
+        transaction.
+
+        Rows without a value are counted as skipped, as in
+        upsert_price_observation. Rows missing a dimension key or period_date
+        are counted as errors rather than stored.
+
+        Args:
+            df: DataFrame with FEWS NET API data
+
+        Returns:
+            dict with counts: {'inserted': n, 'updated': n, 'skipped': n, 'errors': n}
+        """
+        if df.empty:
+            return {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+
+        # Missing columns become NULL so the staging SQL can reference them all
+        staged = df.reindex(columns=SYNC_COLUMNS)
+        self.con.register("bulk_source", staged)
+        try:
+            return self._bulk_sync_relation("bulk_source", len(df))
+        finally:
+            self.con.unregister("bulk_source")
+
+    def sync_parquet(self, path) -> dict:
+        """
+        Sync a Parquet snapshot written by the downloader's parquet format.
+
+        The files are scanned in place with DuckDB's read_parquet (hive
+        partitions such as product=.../year=... are decoded back into
+        columns) and merged through the same set-based path as
+        bulk_sync_dataframe, so the snapshot never passes through pandas.
+
+        Args:
+            path: Snapshot directory, a single .parquet file or a glob
+
+        Returns:
+            dict with counts: {'inserted': n, 'updated': n, 'skipped': n,
+            'errors': n, 'fetched': n, 'start_date': str, 'end_date': str}
+        """
+        path = Path(path)
+        pattern = str(path / "**" / "*.parquet") if path.is_dir() else str(path)
+        scan = (f"read_parquet('{pattern.replace(chr(39), chr(39) * 2)}', "
+                "hive_partitioning = true, union_by_name = true)")
+
+        available = {
+            row[0] for row in self.con.execute(f"DESCRIBE SELECT * FROM {scan}").fetchall()
+        }
+        select_list = ", ".join(
+            col if col in available else f"NULL AS {col}" for col in SYNC_COLUMNS
+        )
+        self.con.execute(
+            f"CREATE OR REPLACE TEMP VIEW parquet_source AS SELECT {select_list} FROM {scan}"
+        )
+
+        try:
+            total, start_date, end_date = self.con.execute("""
+                SELECT COUNT(*),
+                       MIN(TRY_CAST(period_date AS DATE)),
+                       MAX(TRY_CAST(period_date AS DATE))
+                FROM parquet_source
+            """).fetchone()
+            if total:
+                stats = self._bulk_sync_relation("parquet_source", total)
+            else:
+                stats = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+        finally:
+            self.con.execute("DROP VIEW IF EXISTS parquet_source")
 
+        stats["fetched"] = total
+        stats["start_date"] = str(start_date) if start_date else None
+        stats["end_date"] = str(end_date) if end_date else None
+        return stats
+
+    def _bulk_sync_relation(self, source: str, total_rows: int) -> dict:
+        """
+        Merge rows from a registered relation with SYNC_COLUMNS into the schema.
+
+        Args:
+            source: Name of a view or registered DataFrame to read from
+            total_rows: Row count of the source, used to derive error counts
+
+        Returns:
+            dict with counts: {'inserted': n, 'updated': n, 'skipped': n, 'errors': n}
+        """
+        stats = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+
+        try:
+            self.con.begin()
+
+            self.con.execute(f"""
+                CREATE OR REPLACE TEMP TABLE bulk_stage AS
+                SELECT
+                    row_number() OVER () AS row_num,
+                    TRY_CAST(market_id AS INTEGER) AS market_fews_id,
+                    CAST(fnid AS VARCHAR) AS fnid,
+                    CAST(market AS VARCHAR) AS market,
+                    CAST(admin_1 AS VARCHAR) AS admin_1,
+                    CAST(admin_2 AS VARCHAR) AS admin_2,
+                    COALESCE(CAST(country_code AS VARCHAR), 'HT') AS country_code,
+                    TRY_CAST(latitude AS DOUBLE) AS latitude,
+                    TRY_CAST(longitude AS DOUBLE) AS longitude,
+                    CAST(product AS VARCHAR) AS product,
+                    CAST(cpcv2 AS VARCHAR) AS cpcv2,
+                    CAST(cpcv2_description AS VARCHAR) AS cpcv2_description,
+                    CAST(product_source AS VARCHAR) AS product_source,
+                    COALESCE(TRY_CAST(is_staple_food AS BOOLEAN), FALSE) AS is_staple_food,
+                    CAST(unit AS VARCHAR) AS unit,
+                    CAST(unit_type AS VARCHAR) AS unit_type,
+                    CAST(common_unit AS VARCHAR) AS common_unit,
+                    TRY_CAST(datasourceorganization AS INTEGER) AS source_fews_id,
+                    CAST(source_organization AS VARCHAR) AS source_organization,
+                    CAST(source_document AS VARCHAR) AS source_document,
+                    TRY_CAST(period_date AS DATE) AS period_date,
+                    TRY_CAST(start_date AS DATE) AS start_date,
+                    COALESCE(CAST(price_type AS VARCHAR), 'Retail') AS price_type,
+                    COALESCE(CAST(currency AS VARCHAR), 'HTG') AS currency,
+                    TRY_CAST(value AS DOUBLE) AS value,
+                    TRY_CAST(exchange_rate AS DOUBLE) AS exchange_rate,
+                    TRY_CAST(common_unit_price AS DOUBLE) AS common_unit_price,
+                    TRY_CAST(common_currency_price AS DOUBLE) AS common_currency_price,
+                    CAST(collection_status AS VARCHAR) AS collection_status,
+                    TRY_CAST(dataseries AS INTEGER) AS fews_dataseries_id,
+                    TRY_CAST(modified AS TIMESTAMP) AS api_modified_at
+                FROM {source}
+            """)
+
+            # Dimension members: first occurrence wins, as in get_or_create_*
+            self.con.execute("""
+                INSERT INTO markets (fews_id, fnid, name, admin_1, admin_2, country_code, latitude, longitude)
+                SELECT DISTINCT ON (market_fews_id)
+                    market_fews_id, fnid, market, admin_1, admin_2, country_code, latitude, longitude
+                FROM bulk_stage
+                WHERE market_fews_id IS NOT NULL AND fnid IS NOT NULL AND market IS NOT NULL
+                ORDER BY market_fews_id, row_num
+                ON CONFLICT DO NOTHING
+            """)
+            self.con.execute("""
+                INSERT INTO products (name, cpcv2, cpcv2_description, product_source, is_staple_food)
+                SELECT DISTINCT ON (product, product_source)
+                    product, cpcv2, cpcv2_description, product_source, is_staple_food
+                FROM bulk_stage s
+                WHERE product IS NOT NULL
+                  AND NOT EXISTS (
+                      SELECT 1 FROM products p
+                      WHERE p.name = s.product
+                        AND p.product_source IS NOT DISTINCT FROM s.product_source
+                  )
+                ORDER BY product, product_source, row_num
+                ON CONFLICT DO NOTHING
+            """)
+            self.con.execute("""
+                INSERT INTO units (name, unit_type, common_unit)
+                SELECT DISTINCT ON (unit) unit, unit_type, common_unit
+                FROM bulk_stage
+                WHERE unit IS NOT NULL
+                ORDER BY unit, row_num
+                ON CONFLICT DO NOTHING
+            """)
+            self.con.execute("""
+                INSERT INTO data_sources (fews_id, name, document_name)
+                SELECT DISTINCT ON (source_fews_id)
+                    source_fews_id, source_organization, source_document
+                FROM bulk_stage
+                WHERE source_fews_id IS NOT NULL AND source_organization IS NOT NULL
+                ORDER BY source_fews_id, row_num
+                ON CONFLICT DO NOTHING
+            """)
+
+            # Resolve surrogate keys; rows that cannot be resolved are errors
+            self.con.execute("""
+                CREATE OR REPLACE TEMP TABLE bulk_resolved AS
+                SELECT
+                    s.*,
+                    m.id AS market_key,
+                    p.id AS product_key,
+                    u.id AS unit_key,
+                    d.id AS source_key
+                FROM bulk_stage s
+                JOIN markets m ON m.fews_id = s.market_fews_id
+                JOIN (
+                    -- Oldest id of duplicate products, as in _dimension_keys
+                    SELECT name, product_source, MIN(id) AS id
+                    FROM products
+                    GROUP BY name, product_source
+                ) p ON p.name = s.product
+                   AND p.product_source IS NOT DISTINCT FROM s.product_source
+                JOIN units u ON u.name = s.unit
+                LEFT JOIN data_sources d ON d.fews_id = s.source_fews_id
+            """)
+
+            # Rows without a value are skipped, like upsert_price_observation
+            no_value = self.con.execute("""
+                SELECT COUNT(*) FROM bulk_resolved
+                WHERE value IS NULL OR isnan(value)
+            """).fetchone()[0]
+
+            # ON CONFLICT DO UPDATE cannot touch the same row twice, so keep
+            # the last row per key (matching the row-by-row "last write wins")
+            self.con.execute("""
+                CREATE OR REPLACE TEMP TABLE bulk_merge AS
+                SELECT * FROM bulk_resolved
+                WHERE period_date IS NOT NULL AND NOT isnan(value)
+                QUALIFY row_number() OVER (
+                    PARTITION BY market_key, product_key, unit_key, period_date, price_type
+                    ORDER BY row_num DESC
+                ) = 1
+            """)
+
+            # Count outcomes as the row path would: each row is compared with
+            # the previous row for its key, or with the stored observation
+            new_keys, changed, unchanged = self.con.execute("""
+                WITH valid AS (
+                    SELECT
+                        market_key, product_key, unit_key, period_date, price_type,
+                        struct_pack(api_modified_at, value, exchange_rate,
+                                    common_unit_price, common_currency_price,
+                                    collection_status) AS fields,
+                        row_num
+                    FROM bulk_resolved
+                    WHERE period_date IS NOT NULL AND NOT isnan(value)
+                ),
+                ordered AS (
+                    SELECT
+                        v.*,
+                        lag(fields) OVER key_rows AS previous,
+                        row_number() OVER key_rows = 1 AS first_for_key
+                    FROM valid v
+                    WINDOW key_rows AS (
+                        PARTITION BY market_key, product_key, unit_key, period_date, price_type
+                        ORDER BY row_num
+                    )
+                ),
+                compared AS (
+                    SELECT
+                        o.first_for_key,
+                        po.id IS NOT NULL AS stored,
+                        CASE WHEN o.first_for_key
+                             THEN o.fields IS NOT DISTINCT FROM struct_pack(
+                                 api_modified_at := po.api_modified_at,
+                                 value := po.value,
+                                 exchange_rate := po.exchange_rate,
+                                 common_unit_price := po.common_unit_price,
+                                 common_currency_price := po.common_currency_price,
+                                 collection_status := po.collection_status)
+                             ELSE o.fields IS NOT DISTINCT FROM o.previous
+                        END AS same
+                    FROM ordered o
+                    LEFT JOIN price_observations po
+                      ON po.market_id = o.market_key
+                     AND po.product_id = o.product_key
+                     AND po.unit_id = o.unit_key
+                     AND po.period_date = o.period_date
+                     AND po.price_type = o.price_type
+                )
+                SELECT
+                    COUNT(*) FILTER (WHERE first_for_key AND NOT stored),
+                    COUNT(*) FILTER (WHERE (stored OR NOT first_for_key) AND NOT same),
+                    COUNT(*) FILTER (WHERE (stored OR NOT first_for_key) AND same)
+                FROM compared
+            """).fetchone()
+
+            # Drop rows that would not change the stored observation
+            self.con.execute("""
+                DELETE FROM bulk_merge b
+                USING price_observations po
+                WHERE po.market_id = b.market_key
+                  AND po.product_id = b.product_key
+                  AND po.unit_id = b.unit_key
+                  AND po.period_date = b.period_date
+                  AND po.price_type = b.price_type
+                  AND po.api_modified_at IS NOT DISTINCT FROM b.api_modified_at
+                  AND po.value IS NOT DISTINCT FROM b.value
+                  AND po.exchange_rate IS NOT DISTINCT FROM b.exchange_rate
+                  AND po.common_unit_price IS NOT DISTINCT FROM b.common_unit_price
+                  AND po.common_currency_price IS NOT DISTINCT FROM b.common_currency_price
+                  AND po.collection_status IS NOT DISTINCT FROM b.collection_status
+            """)
+
+            self.con.execute("""
+                INSERT INTO price_observations (
+                    market_id, product_id, unit_id, source_id,
+                    period_date, start_date, price_type, currency, value,
+                    exchange_rate, common_unit_price, common_currency_price,
+                    collection_status, fews_dataseries_id, api_modified_at
+                )
+                SELECT
+                    market_key, product_key, unit_key, source_key,
+                    period_date, start_date, price_type, currency, value,
+                    exchange_rate, common_unit_price, common_currency_price,
+                    collection_status, fews_dataseries_id, api_modified_at
+                FROM bulk_merge
+                ON CONFLICT (market_id, product_id, unit_id, period_date, price_type)
+                DO UPDATE SET
+                    value = EXCLUDED.value,
+                    exchange_rate = EXCLUDED.exchange_rate,
+                    common_unit_price = EXCLUDED.common_unit_price,
+                    common_currency_price = EXCLUDED.common_currency_price,
+                    collection_status = EXCLUDED.collection_status,
+                    api_modified_at = EXCLUDED.api_modified_at,
+                    imported_at = get_current_timestamp()
+            """)
+
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+        finally:
+            # New dimension members were inserted outside the key cache
+            self._dim_keys = None
+            self.con.execute("DROP TABLE IF EXISTS bulk_stage")
+            self.con.execute("DROP TABLE IF EXISTS bulk_resolved")
+            self.con.execute("DROP TABLE IF EXISTS bulk_merge")
+
+        stats["inserted"] = new_keys
+        stats["updated"] = changed
+        stats["skipped"] = unchanged + no_value
+        stats["errors"] = total_rows - new_keys - changed - unchanged - no_value
         return stats
 
     def log_import(self, records_fetched: int, stats: dict,
                    start_date: Optional[str], end_date: Optional[str],
-                   status: str = "success", error_message: Optional[str] = None):
+                   status: str = "success", error_message: Optional[str] = None,
+                   country_code: str = "HT"):
         """Log an import operation."""
         self.con.execute("""
             INSERT INTO import_log (
                 records_fetched, records_inserted, records_updated, records_skipped,
-                date_range_start, date_range_end, status, error_message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                date_range_start, date_range_end, status, error_message, country_code
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, [
             records_fetched,
             stats.get("inserted", 0),
@@ -320,21 +964,487 @@ class FEWSDatabase:
             end_date,
             status,
             error_message,
+            country_code,
         ])
 
-    def get_last_sync_date(self) -> Optional[str]:
-        """Get the end date of the last successful sync."""
+    def normalize_units(self) -> list:
+        """
+        Fill units.conversion_factor for units that do not have one yet.
+
+        The factor is parsed from the unit name (parse_unit) when it names a
+        quantity of a known unit compatible with the API's common_unit.
+        Otherwise (e.g. 'marmite') it is derived once from the stored rows as
+        the median of value / common_unit_price. Units with neither stay NULL
+        and are tried again on the next call.
+
+        Returns:
+            List of unit IDs whose conversion_factor was filled in
+        """
+        rows = self.con.execute("""
+            SELECT id, name, common_unit FROM units WHERE conversion_factor IS NULL
+        """).fetchall()
+        if not rows:
+            return []
+
+        parsed = []
+        for unit_id, name, common_unit in rows:
+            result = parse_unit(name)
+            if result and (common_unit is None or common_unit.lower() == result[0].lower()):
+                parsed.append([result[1], result[0], unit_id])
+        if parsed:
+            self.con.executemany("""
+                UPDATE units
+                SET conversion_factor = ?, common_unit = COALESCE(common_unit, ?)
+                WHERE id = ?
+            """, parsed)
+
+        # Fall back to the API's own conversion for the remaining units
+        self.con.execute("""
+            UPDATE units
+            SET conversion_factor = d.factor
+            FROM (
+                SELECT unit_id, MEDIAN(value / common_unit_price) AS factor
+                FROM price_observations
+                WHERE value > 0 AND common_unit_price > 0
+                GROUP BY unit_id
+            ) d
+            WHERE units.id = d.unit_id
+              AND units.conversion_factor IS NULL
+              AND units.common_unit IS NOT NULL
+              AND list_contains(?, units.id)
+        """, [[unit_id for unit_id, _, _ in rows]])
+
+        updated = [row[0] for row in self.con.execute("""
+            SELECT id FROM units
+            WHERE conversion_factor IS NOT NULL AND list_contains(?, id)
+        """, [[unit_id for unit_id, _, _ in rows]]).fetchall()]
+        if updated:
+            print(f"[INFO] Derived conversion factors for {len(updated)} units")
+        return updated
+
+    def refresh_aggregates(self) -> dict:
+        """
+        Refresh the materialized tables (MATERIALIZED_TABLES) after a sync.
+
+        Only partitions touched by rows imported since the last refresh
+        (price_observations.imported_at) are rebuilt: the product-months
+        those rows fall in, and for each touched series every month of
+        agg_series_monthly (LAG and the 12-month moving average look back
+        across the series), its latest_observations row and its rows in
+        price_observations_wide. The first refresh of a database, or of a
+        newly added table, rebuilds everything. Units that receive a
+        conversion factor (normalize_units) have all their series rebuilt,
+        so normalized prices are filled in for rows imported earlier.
+
+        Returns:
+            dict with counts: {'product_months': n, 'series': n}
+        """
+        started = self.con.execute(
+            "SELECT CAST(get_current_timestamp() AS TIMESTAMP)"
+        ).fetchone()[0]
+        refreshed = dict(self.con.execute(
+            "SELECT name, refreshed_at FROM aggregate_state"
+        ).fetchall())
+        # A table that has never been built forces a full rebuild
+        last = None
+        if all(refreshed.get(name) is not None for name in MATERIALIZED_TABLES):
+            last = (min(refreshed[name] for name in MATERIALIZED_TABLES),)
+
+        self.con.begin()
+        try:
+            normalized = self.normalize_units()
+            if last is None:
+                # First refresh: every partition counts as touched
+                self.con.execute("""
+                    CREATE OR REPLACE TEMP TABLE agg_touched AS
+                    SELECT DISTINCT market_id, product_id, unit_id, period_date
+                    FROM price_observations
+                """)
+            else:
+                self.con.execute("""
+                    CREATE OR REPLACE TEMP TABLE agg_touched AS
+                    SELECT DISTINCT market_id, product_id, unit_id, period_date
+                    FROM price_observations
+                    WHERE imported_at >= ? OR list_contains(?, unit_id)
+                """, [last[0], normalized])
+
+            self.con.execute("""
+                CREATE OR REPLACE TEMP TABLE agg_touched_months AS
+                SELECT DISTINCT p.name AS product, t.period_date
+                FROM agg_touched t
+                JOIN products p ON t.product_id = p.id
+            """)
+            self.con.execute("""
+                CREATE OR REPLACE TEMP TABLE agg_touched_series AS
+                SELECT DISTINCT market_id, product_id, unit_id FROM agg_touched
+            """)
+
+            self.con.execute("""
+                DELETE FROM agg_product_monthly a
+                USING agg_touched_months k
+                WHERE a.product = k.product AND a.period_date = k.period_date
+            """)
+            self.con.execute("""
+                INSERT INTO agg_product_monthly
+                SELECT
+                    p.name,
+                    po.period_date,
+                    AVG(po.value),
+                    AVG(po.common_currency_price),
+                    MIN(po.value),
+                    MAX(po.value),
+                    COUNT(DISTINCT po.market_id),
+                    COUNT(*),
+                    AVG(po.value / u.conversion_factor),
+                    AVG(po.common_currency_price / u.conversion_factor)
+                FROM price_observations po
+                JOIN products p ON po.product_id = p.id
+                JOIN units u ON po.unit_id = u.id
+                JOIN agg_touched_months k
+                  ON k.product = p.name AND k.period_date = po.period_date
+                GROUP BY p.name, po.period_date
+            """)
+
+            self.con.execute("""
+                DELETE FROM agg_series_monthly a
+                USING agg_touched_series k
+                WHERE a.market_id = k.market_id
+                  AND a.product_id = k.product_id
+                  AND a.unit_id = k.unit_id
+            """)
+            self.con.execute("""
+                INSERT INTO agg_series_monthly
+                SELECT
+                    po.market_id,
+                    po.product_id,
+                    po.unit_id,
+                    po.period_date,
+                    po.price_type,
+                    po.value,
+                    po.common_currency_price,
+                    LAG(po.value, 1) OVER w,
+                    LAG(po.value, 12) OVER w,
+                    (po.value - LAG(po.value, 1) OVER w) / NULLIF(LAG(po.value, 1) OVER w, 0) * 100,
+                    (po.value - LAG(po.value, 12) OVER w) / NULLIF(LAG(po.value, 12) OVER w, 0) * 100,
+                    AVG(po.value) OVER (
+                        PARTITION BY po.market_id, po.product_id, po.unit_id
+                        ORDER BY po.period_date
+                        ROWS BETWEEN 11 PRECEDING AND CURRENT ROW
+                    )
+                FROM price_observations po
+                SEMI JOIN agg_touched_series k
+                  ON k.market_id = po.market_id
+                 AND k.product_id = po.product_id
+                 AND k.unit_id = po.unit_id
+                WINDOW w AS (
+                    PARTITION BY po.market_id, po.product_id, po.unit_id
+                    ORDER BY po.period_date
+                )
+            """)
+
+            self.con.execute("""
+                DELETE FROM latest_observations l
+                USING agg_touched_series k
+                WHERE l.market_id = k.market_id
+                  AND l.product_id = k.product_id
+                  AND l.unit_id = k.unit_id
+            """)
+            self.con.execute("""
+                INSERT INTO latest_observations
+                SELECT
+                    po.market_id,
+                    po.product_id,
+                    po.unit_id,
+                    po.price_type,
+                    po.id,
+                    po.period_date,
+                    po.value,
+                    po.common_currency_price,
+                    po.exchange_rate
+                FROM price_observations po
+                SEMI JOIN agg_touched_series k
+                  ON k.market_id = po.market_id
+                 AND k.product_id = po.product_id
+                 AND k.unit_id = po.unit_id
+                WHERE po.value IS NOT NULL
+                QUALIFY row_number() OVER (
+                    PARTITION BY po.market_id, po.product_id, po.unit_id, po.price_type
+                    ORDER BY po.period_date DESC
+                ) = 1
+            """)
+
+            self.con.execute("""
+                DELETE FROM price_observations_wide w
+                USING agg_touched_series k
+                WHERE w.market_id = k.market_id
+                  AND w.product_id = k.product_id
+                  AND w.unit_id = k.unit_id
+            """)
+            # Insert in product order so zonemaps prune per-commodity reads
+            self.con.execute("""
+                INSERT INTO price_observations_wide
+                SELECT
+                    po.id,
+                    p.name,
+                    m.name,
+                    po.market_id,
+                    po.product_id,
+                    u.name,
+                    po.unit_id,
+                    po.price_type,
+                    po.period_date,
+                    po.value,
+                    po.common_currency_price,
+                    u.common_unit,
+                    po.value / u.conversion_factor,
+                    po.common_currency_price / u.conversion_factor
+                FROM price_observations po
+                JOIN products p ON po.product_id = p.id
+                JOIN markets m ON po.market_id = m.id
+                JOIN units u ON po.unit_id = u.id
+                SEMI JOIN agg_touched_series k
+                  ON k.market_id = po.market_id
+                 AND k.product_id = po.product_id
+                 AND k.unit_id = po.unit_id
+                ORDER BY p.name, m.name, po.period_date
+            """)
+
+            counts = {
+                "product_months": self.con.execute(
+                    "SELECT COUNT(*) FROM agg_touched_months").fetchone()[0],
+                "series": self.con.execute(
+                    "SELECT COUNT(*) FROM agg_touched_series").fetchone()[0],
+            }
+
+            self.con.executemany("""
+                INSERT INTO aggregate_state (name, refreshed_at)
+                VALUES (?, ?)
+                ON CONFLICT (name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+            """, [[name, started] for name in MATERIALIZED_TABLES])
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+        finally:
+            for table in ("agg_touched", "agg_touched_months", "agg_touched_series"):
+                self.con.execute(f"DROP TABLE IF EXISTS {table}")
+
+        print(f"[INFO] Refreshed aggregates: {counts['product_months']} product-months, "
+              f"{counts['series']} series")
+        return counts
+
+    def get_stale_forecast_products(self) -> list:
+        """
+        List products whose forecasts need precomputing.
+
+        These are the products with observations imported since the last
+        mark_forecasts_refreshed(), or every product if forecasts were never
+        precomputed.
+
+        Returns:
+            Sorted list of product names
+        """
+        refreshed = self.con.execute(
+            "SELECT refreshed_at FROM aggregate_state WHERE name = 'forecasts'"
+        ).fetchone()
+
+        if refreshed is None:
+            rows = self.con.execute("""
+                SELECT DISTINCT name FROM products
+                SEMI JOIN price_observations po ON po.product_id = products.id
+                ORDER BY name
+            """).fetchall()
+        else:
+            rows = self.con.execute("""
+                SELECT DISTINCT p.name
+                FROM price_observations po
+                JOIN products p ON po.product_id = p.id
+                WHERE po.imported_at >= ?
+                ORDER BY p.name
+            """, [refreshed[0]]).fetchall()
+        return [row[0] for row in rows]
+
+    def store_forecasts(self, product: str, currency: str,
+                        forecast_rows: pd.DataFrame, model_rows: pd.DataFrame,
+                        model: str = "prophet"):
+        """
+        Replace the stored forecasts of one product, currency and model.
+
+        Args:
+            product: Product name
+            currency: 'HTG' or 'USD'
+            forecast_rows: Rows for the forecasts table (market, ds, is_forecast,
+                yhat, yhat_lower, yhat_upper, trend, yearly)
+            model_rows: Rows for the forecast_models table (market,
+                n_observations, months_span, sufficient, reason, success, error)
+            model: Forecasting backend the rows come from ('prophet' or 'fast')
+        """
+        self.con.begin()
+        try:
+            for table in ("forecasts", "forecast_models"):
+                self.con.execute(
+                    f"DELETE FROM {table} WHERE product = ? AND currency = ? AND model = ?",
+                    [product, currency, model],
+                )
+
+            if not forecast_rows.empty:
+                self.con.register("forecast_rows", forecast_rows)
+                self.con.execute("""
+                    INSERT INTO forecasts (product, currency, model, market, ds, is_forecast,
+                                           yhat, yhat_lower, yhat_upper, trend, yearly)
+                    SELECT ?, ?, ?, market, ds, is_forecast, yhat, yhat_lower, yhat_upper,
+                           trend, yearly
+                    FROM forecast_rows
+                """, [product, currency, model])
+                self.con.unregister("forecast_rows")
+
+            if not model_rows.empty:
+                self.con.register("model_rows", model_rows)
+                self.con.execute("""
+                    INSERT INTO forecast_models (product, currency, model, market,
+                                                 n_observations, months_span, sufficient,
+                                                 reason, success, error, generated_at)
+                    SELECT ?, ?, ?, market, n_observations, months_span, sufficient, reason,
+                           success, error, get_current_timestamp()
+                    FROM model_rows
+                """, [product, currency, model])
+                self.con.unregister("model_rows")
+
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+
+    def mark_forecasts_refreshed(self, refreshed_at: datetime):
+        """
+        Record when forecasts were last precomputed.
+
+        Args:
+            refreshed_at: Time the run started (rows imported later are stale)
+        """
+        self.con.execute("""
+            INSERT INTO aggregate_state (name, refreshed_at)
+            VALUES ('forecasts', ?)
+            ON CONFLICT (name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+        """, [refreshed_at])
+
+    def get_last_sync_date(self, country_code: str = "HT") -> Optional[str]:
+        """Get the end date of the last successful sync for a country."""
         result = self.con.execute("""
             SELECT date_range_end FROM import_log
-            WHERE status = 'success'
+            WHERE status = 'success' AND COALESCE(country_code, 'HT') = ?
             ORDER BY import_date DESC
             LIMIT 1
-        """).fetchone()
+        """, [country_code]).fetchone()
 
         if result and result[0]:
             return str(result[0])
         return None
 
+    def get_modified_high_water(self, country_code: str = "HT") -> Optional[pd.Timestamp]:
+        """
+        Get the API 'modified' high-water mark for a country.
+
+        Falls back to the newest api_modified_at stored for the country's
+        markets, so databases populated before sync_state existed can switch
+        to modified-based syncs without another full sync.
+
+        Args:
+            country_code: ISO country code
+
+        Returns:
+            Timestamp of the newest synced revision, or None if nothing is stored
+        """
+        result = self.con.execute("""
+            SELECT modified_high_water FROM sync_state WHERE country_code = ?
+        """, [country_code]).fetchone()
+
+        if result and result[0] is not None:
+            return pd.Timestamp(result[0])
+        return self.get_stored_modified_max(country_code)
+
+    def get_stored_modified_max(self, country_code: str = "HT") -> Optional[pd.Timestamp]:
+        """Get the newest api_modified_at stored for a country's markets."""
+        result = self.con.execute("""
+            SELECT MAX(po.api_modified_at)
+            FROM price_observations po
+            JOIN markets m ON po.market_id = m.id
+            WHERE m.country_code = ?
+        """, [country_code]).fetchone()
+
+        if result and result[0] is not None:
+            return pd.Timestamp(result[0])
+        return None
+
+    def set_modified_high_water(self, country_code: str, high_water: pd.Timestamp):
+        """Record the API 'modified' high-water mark for a country."""
+        self.con.execute("""
+            INSERT INTO sync_state (country_code, modified_high_water)
+            VALUES (?, ?)
+            ON CONFLICT (country_code) DO UPDATE SET
+                modified_high_water = EXCLUDED.modified_high_water,
+                updated_at = get_current_timestamp()
+        """, [country_code, pd.Timestamp(high_water).to_pydatetime()])
+
+    def start_checkpoint_run(self, windows: list) -> list:
+        """
+        Start a checkpointed sync, replacing any previous run's checkpoints.
+
+        Args:
+            windows: List of (start_date, end_date) fetch windows
+
+        Returns:
+            The run's checkpoints, as returned by get_checkpoint_run
+        """
+        self.con.begin()
+        try:
+            self.con.execute("DELETE FROM sync_checkpoints")
+            self.con.executemany("""
+                INSERT INTO sync_checkpoints (window_start, window_end)
+                VALUES (?, ?)
+            """, [list(window) for window in windows])
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+        return self.get_checkpoint_run()
+
+    def get_checkpoint_run(self) -> Optional[list]:
+        """
+        Get the checkpoints of the last checkpointed sync, if it is unfinished.
+
+        Returns:
+            List of dicts with window_start, window_end (YYYY-MM-DD),
+            rows_ingested and completed, in window order; None if there is
+            no run or every window completed
+        """
+        rows = self.con.execute("""
+            SELECT window_start, window_end, rows_ingested, completed
+            FROM sync_checkpoints
+            ORDER BY window_start
+        """).fetchall()
+
+        if not rows or all(completed for *_, completed in rows):
+            return None
+        return [
+            {
+                "window_start": str(window_start),
+                "window_end": str(window_end),
+                "rows_ingested": rows_ingested,
+                "completed": completed,
+            }
+            for window_start, window_end, rows_ingested, completed in rows
+        ]
+
+    def save_checkpoint(self, window_start: str, rows_ingested: int,
+                        completed: bool = False):
+        """Record how many rows of a fetch window have been ingested."""
+        self.con.execute("""
+            UPDATE sync_checkpoints
+            SET rows_ingested = ?, completed = ?, updated_at = get_current_timestamp()
+            WHERE window_start = ?
+        """, [rows_ingested, completed, window_start])
+
     def get_stats(self) -> dict:
         """Get database statistics."""
         stats = {}
@@ -362,3 +1472,134 @@ class FEWSDatabase:
     def query(self, sql: str) -> pd.DataFrame:
         """Execute a query and return results as DataFrame."""
         return self.con.execute(sql).fetchdf()
+
+
+class DatabaseLockedError(RuntimeError):
+    """Raised when another process holds the database's WriterLock."""
+
+
+class WriterLock:
+    """
+    Lock file that lets only one process write the database at a time.
+
+    The lock is <db>.lock, created atomically with O_EXCL and holding the
+    owner's pid and host. A lock left by a dead process on this host is
+    removed automatically. Elsewhere, delete the file by hand once the
+    owning sync is known to be gone.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        db_path = Path(db_path or DEFAULT_DB_PATH)
+        self.path = db_path.with_name(db_path.name + ".lock")
+
+    def _holder(self) -> dict:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _is_stale(self, holder: dict) -> bool:
+        # os.kill(pid, 0) only probes on POSIX; on Windows it would terminate the process
+        if os.name != "posix" or holder.get("host") != socket.gethostname():
+            return False
+        try:
+            os.kill(int(holder["pid"]), 0)
+        except ProcessLookupError:
+            return True
+        except (KeyError, ValueError, PermissionError):
+            return False
+        return False
+
+    def acquire(self):
+        """Take the lock, raising DatabaseLockedError if another live process holds it."""
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                holder = self._holder()
+                if self._is_stale(holder):
+                    print(f"[WARN] Removing stale lock left by pid {holder.get('pid')}")
+                    self.path.unlink(missing_ok=True)
+                    continue
+                raise DatabaseLockedError(
+                    f"Database is locked by pid {holder.get('pid')} on "
+                    f"{holder.get('host')} since {holder.get('started')} ({self.path})"
+                )
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "pid": os.getpid(),
+                    "host": socket.gethostname(),
+                    "started": datetime.now().isoformat(timespec="seconds"),
+                }, f)
+            return self
+        raise DatabaseLockedError(f"Could not acquire database lock: {self.path}")
+
+    def release(self):
+        """Release the lock."""
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+@contextmanager
+def open_writer(db_path: Optional[Path] = None, staged: bool = False):
+    """
+    Open the database for writing while holding its WriterLock.
+
+    With staged, the database file is copied to <db>.staging, all writes go
+    to the copy, and on success the copy is checkpointed and moved over the
+    live file with os.replace. Readers (e.g. the dashboard) never see the
+    writer's file lock or a half-finished sync: a new read-only connection
+    opens either the old file or the new one. If the sync raises, the
+    staging copy is discarded and the live file is untouched.
+
+    On Windows, os.replace fails while a reader has the live file open; the
+    error is raised and the live file is left as it was.
+
+    Args:
+        db_path: Path to the DuckDB file. Defaults to DEFAULT_DB_PATH.
+        staged: Write to a staging copy and swap it into place
+
+    Yields:
+        A connected FEWSDatabase
+    """
+    db_path = Path(db_path or DEFAULT_DB_PATH)
+
+    with WriterLock(db_path):
+        if not staged:
+            with FEWSDatabase(db_path) as db:
+                yield db
+            return
+
+        staging = db_path.with_name(db_path.name + ".staging")
+        live_wal = db_path.with_name(db_path.name + ".wal")
+        staging_wal = staging.with_name(staging.name + ".wal")
+
+        # Leftovers from an interrupted staged sync
+        staging.unlink(missing_ok=True)
+        staging_wal.unlink(missing_ok=True)
+
+        if db_path.exists():
+            print(f"[INFO] Staging a copy of {db_path.name}...")
+            shutil.copy2(db_path, staging)
+            # Un-checkpointed changes are replayed into the copy when it opens
+            if live_wal.exists():
+                shutil.copy2(live_wal, staging_wal)
+
+        try:
+            with FEWSDatabase(staging) as db:
+                yield db
+                db.con.execute("CHECKPOINT")
+        except BaseException:
+            staging.unlink(missing_ok=True)
+            staging_wal.unlink(missing_ok=True)
+            raise
+
+        # The old WAL must not be replayed onto the new file
+        live_wal.unlink(missing_ok=True)
+        os.replace(staging, db_path)
+        print(f"[OK] Swapped staged database into place: {db_path}")
@@ -46,7 +46,7 @@ CREATE TABLE IF NOT EXISTS units (
     name VARCHAR NOT NULL UNIQUE,        -- e.g., 6_lb, 175_g, 350_g
     unit_type VARCHAR,                   -- e.g., Weight
     common_unit VARCHAR,                 -- e.g., kg (standardized)
-    conversion_factor DOUBLE             -- To convert to common_unit
+    conversion_factor DOUBLE             -- common_unit per unit (filled by FEWSDatabase.normalize_units)
 );
 
 -- Data sources dimension table
@@ -116,23 +116,172 @@ CREATE TABLE IF NOT EXISTS import_log (
     date_range_start DATE,
     date_range_end DATE,
     status VARCHAR,                      -- success, failed, partial
-    error_message VARCHAR
+    error_message VARCHAR,
+    country_code VARCHAR                 -- Country synced (NULL rows predate multi-country sync: HT)
+);
+
+-- Databases created before multi-country sync lack the column
+ALTER TABLE import_log ADD COLUMN IF NOT EXISTS country_code VARCHAR;
+
+-- Sync state: high-water mark on the API 'modified' field per country
+CREATE TABLE IF NOT EXISTS sync_state (
+    country_code VARCHAR PRIMARY KEY,
+    modified_high_water TIMESTAMP,       -- Latest 'modified' value fully synced
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Checkpoints of the current checkpointed full sync (--full --checkpoint/--resume)
+CREATE TABLE IF NOT EXISTS sync_checkpoints (
+    window_start DATE PRIMARY KEY,       -- Fetch window start
+    window_end DATE NOT NULL,            -- Fetch window end
+    rows_ingested INTEGER DEFAULT 0,     -- Rows of the window stored so far (progress only)
+    completed BOOLEAN DEFAULT FALSE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================================
+-- MATERIALIZED AGGREGATES
+-- ============================================================
+-- Maintained by FEWSDatabase.refresh_aggregates at the end of each sync.
+-- No keys: touched partitions are replaced by delete + insert in one transaction.
+
+-- Per product and month, across all markets (dashboard mean price chart)
+CREATE TABLE IF NOT EXISTS agg_product_monthly (
+    product VARCHAR NOT NULL,            -- products.name (all sources and units)
+    period_date DATE NOT NULL,
+    mean_price_htg DOUBLE,
+    mean_price_usd DOUBLE,
+    min_price_htg DOUBLE,
+    max_price_htg DOUBLE,
+    num_markets INTEGER,
+    num_observations INTEGER,
+    mean_norm_price_htg DOUBLE,          -- Mean price per common unit (kg or L)
+    mean_norm_price_usd DOUBLE
+);
+ALTER TABLE agg_product_monthly ADD COLUMN IF NOT EXISTS mean_norm_price_htg DOUBLE;
+ALTER TABLE agg_product_monthly ADD COLUMN IF NOT EXISTS mean_norm_price_usd DOUBLE;
+
+-- Per series (market x product x unit) and month, with period-over-period changes
+CREATE TABLE IF NOT EXISTS agg_series_monthly (
+    market_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    unit_id INTEGER NOT NULL,
+    period_date DATE NOT NULL,
+    price_type VARCHAR,
+    price DOUBLE,
+    price_usd DOUBLE,
+    price_1m_ago DOUBLE,
+    price_1y_ago DOUBLE,
+    pct_change_1m DOUBLE,
+    pct_change_1y DOUBLE,
+    moving_avg_12m DOUBLE
+);
+
+-- Latest priced observation per series (market x product x unit x price type)
+CREATE TABLE IF NOT EXISTS latest_observations (
+    market_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    unit_id INTEGER NOT NULL,
+    price_type VARCHAR,
+    observation_id INTEGER NOT NULL,     -- price_observations.id
+    period_date DATE NOT NULL,
+    value DOUBLE,
+    common_currency_price DOUBLE,
+    exchange_rate DOUBLE
+);
+
+-- Denormalized copy of price_observations for read paths (dashboard, forecasting):
+-- dimension names are stored inline, so reads filter on product without joins.
+-- Low-cardinality VARCHARs are dictionary-compressed by DuckDB's storage.
+CREATE TABLE IF NOT EXISTS price_observations_wide (
+    observation_id INTEGER NOT NULL,     -- price_observations.id
+    product VARCHAR NOT NULL,            -- products.name
+    market VARCHAR NOT NULL,             -- markets.name
+    market_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    unit VARCHAR NOT NULL,               -- units.name
+    unit_id INTEGER NOT NULL,
+    price_type VARCHAR,
+    period_date DATE NOT NULL,
+    value DOUBLE,                        -- Price in local currency (HTG)
+    common_currency_price DOUBLE,        -- Price in USD
+    common_unit VARCHAR,                 -- units.common_unit (kg or L)
+    norm_price DOUBLE,                   -- value / units.conversion_factor
+    norm_price_usd DOUBLE                -- common_currency_price / units.conversion_factor
+);
+ALTER TABLE price_observations_wide ADD COLUMN IF NOT EXISTS common_unit VARCHAR;
+ALTER TABLE price_observations_wide ADD COLUMN IF NOT EXISTS norm_price DOUBLE;
+ALTER TABLE price_observations_wide ADD COLUMN IF NOT EXISTS norm_price_usd DOUBLE;
+
+-- ============================================================
+-- PRECOMPUTED FORECASTS
+-- ============================================================
+-- Written after each sync by sync_fews_db.py (precompute_forecasts) and read by
+-- the dashboard's forecast tab. Each (product, currency, model) is replaced as a
+-- whole.
+
+-- Fitted history and future months of each model
+CREATE TABLE IF NOT EXISTS forecasts (
+    product VARCHAR NOT NULL,            -- products.name
+    currency VARCHAR NOT NULL,           -- HTG or USD
+    market VARCHAR NOT NULL,             -- markets.name or 'Market Average'
+    ds DATE NOT NULL,
+    is_forecast BOOLEAN NOT NULL,        -- After the last observed month
+    yhat DOUBLE,
+    yhat_lower DOUBLE,                   -- 95% interval
+    yhat_upper DOUBLE,
+    trend DOUBLE,
+    yearly DOUBLE,                       -- Multiplicative yearly seasonality (NULL if not fitted)
+    model VARCHAR DEFAULT 'prophet'      -- Forecasting backend: prophet | fast
+);
+ALTER TABLE forecasts ADD COLUMN IF NOT EXISTS model VARCHAR DEFAULT 'prophet';
+
+-- Data availability and fit status of each market considered for a forecast
+CREATE TABLE IF NOT EXISTS forecast_models (
+    product VARCHAR NOT NULL,
+    currency VARCHAR NOT NULL,
+    market VARCHAR NOT NULL,
+    n_observations INTEGER,
+    months_span DOUBLE,
+    sufficient BOOLEAN,                  -- Enough data to fit a model
+    reason VARCHAR,                      -- Why not, when not sufficient
+    success BOOLEAN,                     -- NULL when no model was fitted
+    error VARCHAR,
+    generated_at TIMESTAMP,
+    model VARCHAR DEFAULT 'prophet'      -- Forecasting backend: prophet | fast
+);
+ALTER TABLE forecast_models ADD COLUMN IF NOT EXISTS model VARCHAR DEFAULT 'prophet';
+
+-- Database-wide settings (e.g. layout: indexed | clustered)
+CREATE TABLE IF NOT EXISTS db_settings (
+    name VARCHAR PRIMARY KEY,
+    value VARCHAR
+);
+
+-- Last refresh of each materialized table (rows imported later are refreshed next)
+CREATE TABLE IF NOT EXISTS aggregate_state (
+    name VARCHAR PRIMARY KEY,            -- Materialized table name (or 'forecasts')
+    refreshed_at TIMESTAMP
 );
 
 -- ============================================================
 -- INDEXES
 -- ============================================================
 
-CREATE INDEX IF NOT EXISTS idx_price_obs_date ON price_observations(period_date);
-CREATE INDEX IF NOT EXISTS idx_price_obs_market ON price_observations(market_id);
-CREATE INDEX IF NOT EXISTS idx_price_obs_product ON price_observations(product_id);
-CREATE INDEX IF NOT EXISTS idx_price_obs_market_product ON price_observations(market_id, product_id);
+-- The secondary idx_price_obs_* indexes depend on the storage layout and are
+-- created (or dropped) by FEWSDatabase.create_tables; see SECONDARY_INDEXES.
+CREATE INDEX IF NOT EXISTS idx_price_obs_imported ON price_observations(imported_at);
+CREATE INDEX IF NOT EXISTS idx_agg_product_monthly ON agg_product_monthly(product, period_date);
+CREATE INDEX IF NOT EXISTS idx_agg_series_monthly ON agg_series_monthly(market_id, product_id, unit_id);
+CREATE INDEX IF NOT EXISTS idx_latest_observations ON latest_observations(market_id, product_id, unit_id);
+CREATE INDEX IF NOT EXISTS idx_price_obs_wide_series ON price_observations_wide(market_id, product_id, unit_id);
+CREATE INDEX IF NOT EXISTS idx_forecasts ON forecasts(product, currency, model);
 
 -- ============================================================
 -- VIEWS (Optional convenience views)
 -- ============================================================
 
--- View: Latest prices with market and product names
+-- View: Latest price of every series, whenever it was last observed (read from latest_observations)
 CREATE OR REPLACE VIEW v_latest_prices AS
 SELECT
     m.name AS market,
@@ -140,36 +289,31 @@ SELECT
     p.name AS product,
     p.product_source,
     u.name AS unit,
-    po.period_date,
-    po.value AS price_htg,
-    po.common_currency_price AS price_usd,
-    po.exchange_rate
-FROM price_observations po
-JOIN markets m ON po.market_id = m.id
-JOIN products p ON po.product_id = p.id
-JOIN units u ON po.unit_id = u.id
-WHERE po.period_date = (SELECT MAX(period_date) FROM price_observations);
-
--- View: Price time series with computed changes
+    lo.period_date,
+    lo.value AS price_htg,
+    lo.common_currency_price AS price_usd,
+    lo.exchange_rate,
+    lo.price_type
+FROM latest_observations lo
+JOIN markets m ON lo.market_id = m.id
+JOIN products p ON lo.product_id = p.id
+JOIN units u ON lo.unit_id = u.id;
+
+-- View: Price time series with computed changes (read from agg_series_monthly)
 CREATE OR REPLACE VIEW v_price_timeseries AS
 SELECT
     m.name AS market,
     p.name AS product,
     u.name AS unit,
-    po.period_date,
-    po.value AS price,
-    po.common_currency_price AS price_usd,
-    LAG(po.value, 1) OVER w AS price_1m_ago,
-    LAG(po.value, 12) OVER w AS price_1y_ago,
-    (po.value - LAG(po.value, 1) OVER w) / NULLIF(LAG(po.value, 1) OVER w, 0) * 100 AS pct_change_1m,
-    (po.value - LAG(po.value, 12) OVER w) / NULLIF(LAG(po.value, 12) OVER w, 0) * 100 AS pct_change_1y,
-    AVG(po.value) OVER (
-        PARTITION BY po.market_id, po.product_id, po.unit_id
-        ORDER BY po.period_date
-        ROWS BETWEEN 11 PRECEDING AND CURRENT ROW
-    ) AS moving_avg_12m
-FROM price_observations po
-JOIN markets m ON po.market_id = m.id
-JOIN products p ON po.product_id = p.id
-JOIN units u ON po.unit_id = u.id
-WINDOW w AS (PARTITION BY po.market_id, po.product_id, po.unit_id ORDER BY po.period_date);
+    a.period_date,
+    a.price,
+    a.price_usd,
+    a.price_1m_ago,
+    a.price_1y_ago,
+    a.pct_change_1m,
+    a.pct_change_1y,
+    a.moving_avg_12m
+FROM agg_series_monthly a
+JOIN markets m ON a.market_id = m.id
+JOIN products p ON a.product_id = p.id
+JOIN units u ON a.unit_id = u.id;
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+FEWS NET Async API Client
+=========================
+Asyncio variant of FEWSNETClient for driving many API requests concurrently.
+
+Provides the same get_market_prices / get_markets / get_commodities surface as
+FEWSNETClient, plus:
+- A single pooled HTTP connection (aiohttp) shared by all requests
+- A token-bucket rate limiter so concurrent requests stay polite
+- One retry/backoff policy (no stacked adapter + manual retries)
+
+Requirements:
+    pip install aiohttp pandas
+
+Usage:
+    import asyncio
+    from fewsnet_async_client import AsyncFEWSNETClient
+
+    async def main():
+        async with AsyncFEWSNETClient() as client:
+            return await client.get_market_prices_windowed("2005-01-01", "2025-12-31")
+
+    df = asyncio.run(main())
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime
+
+import aiohttp
+import pandas as pd
+
+from fewsnet_haiti_downloader import (
+    BASE_URL,
+    COUNTRY_CODE,
+    FETCH_WORKERS,
+    MAX_RETRIES,
+    REQUEST_TIMEOUT,
+    date_windows,
+)
+
+RATE_LIMIT = 4.0  # Requests per second
+RATE_BURST = 4  # Requests allowed back-to-back before throttling
+BACKOFF_BASE = 2  # Wait 2, 4, 8 seconds between retries
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for asyncio tasks."""
+
+    def __init__(self, rate: float = RATE_LIMIT, capacity: int = RATE_BURST):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncFEWSNETClient:
+    """Asyncio client for the FEWS NET Data Warehouse API (public, no auth required)."""
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        max_connections: int = FETCH_WORKERS,
+        rate: float = RATE_LIMIT,
+        burst: int = RATE_BURST,
+        max_retries: int = MAX_RETRIES,
+        timeout: float = REQUEST_TIMEOUT,
+    ):
+        """
+        Args:
+            base_url: API root (override to point at a local stub server)
+            max_connections: Size of the shared HTTP connection pool
+            rate: Maximum sustained requests per second
+            burst: Requests allowed back-to-back before rate limiting
+            max_retries: Retries per request after the first attempt
+            timeout: Total timeout per request in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.limiter = TokenBucket(rate, burst)
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled HTTP session."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def _make_request(self, endpoint, params=None, format="json"):
+        """
+        Make a rate-limited request with exponential backoff.
+
+        Retries on connection errors, timeouts and HTTP 429/5xx, honouring a
+        numeric Retry-After header when the server sends one.
+        """
+        url = f"{self.base_url}/{endpoint}/"
+        params = dict(params or {}, format=format)
+
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire()
+            retry_after = None
+            try:
+                async with self.session.get(url, params=params) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                        retry_after = response.headers.get("Retry-After")
+                        error = f"HTTP {response.status}"
+                    else:
+                        response.raise_for_status()
+                        if format == "json":
+                            return await response.json(content_type=None)
+                        return await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                error = type(e).__name__
+
+            if retry_after and retry_after.isdigit():
+                wait = int(retry_after)
+            else:
+                wait = BACKOFF_BASE ** (attempt + 1) + random.uniform(0, 1)
+            print(f"[WARN] {error} for {endpoint}, retrying in {wait:.1f}s... "
+                  f"(attempt {attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(wait)
+
+    async def get_market_prices(
+        self,
+        country_code=COUNTRY_CODE,
+        start_date=None,
+        end_date=None,
+        product=None,
+        market=None,
+        limit=None,
+    ):
+        """
+        Fetch market price data.
+
+        Args:
+            country_code: ISO country code (default: 'HT' for Haiti)
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+            product: Filter by product name (e.g., 'Beans (Black)')
+            market: Filter by market name (e.g., 'Port-au-Prince')
+            limit: Maximum number of records to return
+
+        Returns:
+            pandas DataFrame with market price data
+        """
+        params = {"country_code": country_code}
+
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if product:
+            params["product"] = product
+        if market:
+            params["market"] = market
+        if limit:
+            params["limit"] = limit
+
+        json_data = await self._make_request("marketpricefacts", params, format="json")
+        return pd.DataFrame(json_data)
+
+    async def get_market_prices_many(self, requests):
+        """
+        Run several get_market_prices requests concurrently.
+
+        Args:
+            requests: List of keyword-argument dicts for get_market_prices
+
+        Returns:
+            pandas DataFrame with all results, concatenated in request order
+        """
+        done = 0
+
+        async def fetch(kwargs):
+            nonlocal done
+            df = await self.get_market_prices(**kwargs)
+            done += 1
+            shown = {key: value for key, value in kwargs.items() if value is not None}
+            print(f"[INFO] {done}/{len(requests)} requests done "
+                  f"({shown}: {len(df)} records)")
+            return df
+
+        frames = await asyncio.gather(*(fetch(kwargs) for kwargs in requests))
+        frames = [frame for frame in frames if not frame.empty]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+        print(f"[OK] Retrieved {len(df)} records")
+        return df
+
+    async def get_market_prices_windowed(
+        self,
+        start_date,
+        end_date=None,
+        window_months=12,
+        country_code=COUNTRY_CODE,
+        product=None,
+        market=None,
+    ):
+        """Fetch market prices as concurrent date windows, concatenated in date order."""
+        end_date = end_date or datetime.now().strftime("%Y-%m-%d")
+        windows = date_windows(start_date, end_date, window_months)
+        print(f"[INFO] Fetching market prices in {len(windows)} windows "
+              f"of {window_months} months (async)...")
+        return await self.get_market_prices_many([
+            {
+                "country_code": country_code,
+                "start_date": window_start,
+                "end_date": window_end,
+                "product": product,
+                "market": market,
+            }
+            for window_start, window_end in windows
+        ])
+
+    async def get_markets(self, country_code=COUNTRY_CODE):
+        """Get list of markets for a country."""
+        data = await self._make_request("market", {"country_code": country_code}, format="json")
+        return pd.DataFrame(data)
+
+    async def get_commodities(self, country_code=COUNTRY_CODE):
+        """Get list of commodities available for a country."""
+        # Get sample to extract unique products
+        data = await self._make_request(
+            "marketpricefacts",
+            {"country_code": country_code, "limit": 10000},
+            format="json"
+        )
+        df = pd.DataFrame(data)
+
+        if "product" in df.columns:
+            return pd.DataFrame({"product": sorted(df["product"].unique())})
+        return pd.DataFrame()
+
+    async def test_connection(self):
+        """Test API connection using the faster markets endpoint."""
+        try:
+            await self._make_request("market", {"country_code": COUNTRY_CODE}, format="json")
+            print("[OK] API connection successful!")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Connection test failed: {e}")
+            return False
@@ -8,6 +8,7 @@ The FEWS NET price data is PUBLIC and requires NO authentication!
 
 Requirements:
     pip install requests pandas
+    pip install duckdb  # only for Parquet snapshots
 
 Usage:
     python fewsnet_haiti_downloader.py
@@ -19,8 +20,13 @@ Available Data:
     - Monthly collection frequency
 """
 
+import hashlib
+import json
+import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from io import StringIO
 from pathlib import Path
@@ -36,12 +42,201 @@ OUTPUT_DIR = Path(__file__).parent / "data"
 COUNTRY_CODE = "HT"  # Haiti
 REQUEST_TIMEOUT = 300  # 5 minutes
 MAX_RETRIES = 3
+FETCH_WORKERS = 4  # Concurrent requests for windowed fetches
+STREAM_BATCH_SIZE = 10000  # Records per DataFrame when streaming
+PARQUET_COMPRESSION = "zstd"  # Codec for Parquet snapshots
+
+# Compact dtypes for marketpricefacts columns. Price columns stay float64
+# because they are stored as DOUBLE and compared exactly on re-sync.
+PRICE_DTYPES = {
+    "market": "category",
+    "product": "category",
+    "unit": "category",
+    "currency": "category",
+    "admin_1": "category",
+    "admin_2": "category",
+    "fnid": "category",
+    "cpcv2": "category",
+    "cpcv2_description": "category",
+    "product_source": "category",
+    "unit_type": "category",
+    "common_unit": "category",
+    "price_type": "category",
+    "collection_status": "category",
+    "source_organization": "category",
+    "source_document": "category",
+    "country_code": "category",
+    "market_id": "Int32",
+    "dataseries": "Int32",
+    "datasourceorganization": "Int32",
+    "latitude": "float32",
+    "longitude": "float32",
+    "period_date": "datetime64[ns]",
+    "start_date": "datetime64[ns]",
+    "modified": "datetime64[ns]",
+}
+CACHE_DIR = Path(__file__).parent / ".cache" / "api"
+CACHE_TTL = 3600  # Serve cached responses without revalidating for 1 hour
+CACHE_MAX_BYTES = 500 * 1024 * 1024  # Evict least recently used entries above 500 MB
+
+
+def apply_column_plan(df, columns=None, dtypes=None):
+    """
+    Project a price DataFrame to a set of columns and apply a dtype plan.
+
+    Args:
+        df: DataFrame from the API
+        columns: Columns to keep (missing ones are ignored); None keeps all
+        dtypes: Mapping of column name to dtype (e.g. PRICE_DTYPES)
+
+    Returns:
+        The projected, typed DataFrame
+    """
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    if not dtypes:
+        return df
+
+    df = df.copy()
+    for col, dtype in dtypes.items():
+        if col not in df.columns:
+            continue
+        if dtype.startswith("datetime64"):
+            df[col] = pd.to_datetime(df[col], errors="coerce", format="ISO8601")
+        elif dtype == "category":
+            df[col] = df[col].astype("category")
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+    return df
+
+
+def date_windows(start_date, end_date, months):
+    """
+    Split an inclusive YYYY-MM-DD date range into consecutive windows.
+
+    Args:
+        start_date: Range start (YYYY-MM-DD)
+        end_date: Range end (YYYY-MM-DD)
+        months: Length of each window in months
+
+    Returns:
+        List of (start, end) YYYY-MM-DD tuples that do not overlap
+    """
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    windows = []
+    while start <= end:
+        window_end = min(start + pd.DateOffset(months=months) - timedelta(days=1), end)
+        windows.append((start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+class ResponseCache:
+    """
+    On-disk cache of API responses with TTL, HTTP revalidation and LRU eviction.
+
+    Each entry is stored as <key>.body (raw response bytes) and <key>.json
+    (ETag, Last-Modified, fetch and last-use times), keyed by a hash of the
+    URL and query parameters.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory for cache files
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Total body size above which least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, params):
+        """Return the cache key for a URL and its query parameters."""
+        raw = json.dumps([url, sorted((str(k), str(v)) for k, v in params.items())])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return (metadata, body) for a cached entry, or (None, None)."""
+        meta_path = self.cache_dir / f"{key}.json"
+        body_path = self.cache_dir / f"{key}.body"
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None, None
+        return meta, body
+
+    def is_fresh(self, meta):
+        """Return True if an entry can be served without revalidation."""
+        return time.time() - meta["fetched_at"] < self.ttl
+
+    def put(self, key, body, etag=None, last_modified=None):
+        """Store a response body and its validators, then enforce the size bound."""
+        now = time.time()
+        meta = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": now,
+            "last_used": now,
+            "size": len(body),
+        }
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write(self.cache_dir / f"{key}.body", body)
+            self._write(self.cache_dir / f"{key}.json", json.dumps(meta).encode("utf-8"))
+            self._evict()
+
+    def touch(self, key, meta, revalidated=False):
+        """Record a cache hit (and a successful 304 revalidation)."""
+        meta["last_used"] = time.time()
+        if revalidated:
+            meta["fetched_at"] = meta["last_used"]
+        with self._lock:
+            self._write(self.cache_dir / f"{key}.json", json.dumps(meta).encode("utf-8"))
+
+    def _write(self, path, data):
+        """Write a file atomically so readers never see a partial entry."""
+        # Unique per process and thread, as several downloaders can share a cache
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                continue
+            entries.append((meta.get("last_used", 0), meta.get("size", 0), meta_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            meta_path.with_suffix(".body").unlink(missing_ok=True)
+            total -= size
 
 
 class FEWSNETClient:
     """Client for the FEWS NET Data Warehouse API (public, no auth required)."""
 
-    def __init__(self):
+    def __init__(self, use_cache=True, cache_dir=CACHE_DIR, cache_ttl=CACHE_TTL,
+                 cache_max_bytes=CACHE_MAX_BYTES):
+        """
+        Args:
+            use_cache: Serve repeated requests from the on-disk response cache
+            cache_dir: Directory for cached responses
+            cache_ttl: Seconds a cached response is used without revalidation
+            cache_max_bytes: Size bound for the cache (LRU eviction)
+        """
+        self.cache = ResponseCache(cache_dir, cache_ttl, cache_max_bytes) if use_cache else None
         self.session = requests.Session()
         # Configure retries
         retry_strategy = Retry(
@@ -54,17 +249,65 @@ class FEWSNETClient:
         self.session.mount("http://", adapter)
 
     def _make_request(self, endpoint, params=None, format="json"):
-        """Make a request to the FEWS NET API with retries."""
+        """
+        Make a request to the FEWS NET API with retries.
+
+        When the response cache is enabled, fresh entries are served from disk
+        and stale ones are revalidated with If-None-Match / If-Modified-Since.
+        """
         url = f"{BASE_URL}/{endpoint}/"
         if params is None:
             params = {}
         params["format"] = format
 
+        if self.cache is None:
+            return self._fetch(url, params, format)
+
+        key = self.cache.key(url, params)
+        meta, body = self.cache.get(key)
+        if meta is not None and self.cache.is_fresh(meta):
+            self.cache.touch(key, meta)
+            return self._decode(body, format)
+
+        # Revalidate a stale entry with a conditional request
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self._fetch(url, params, format, headers=headers, raw=True)
+        if response.status_code == 304 and meta is not None:
+            self.cache.touch(key, meta, revalidated=True)
+            return self._decode(body, format)
+
+        self.cache.put(
+            key,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return self._decode(response.content, format)
+
+    @staticmethod
+    def _decode(body, format):
+        """Decode a cached or fetched response body."""
+        if format == "json":
+            return json.loads(body)
+        return body.decode("utf-8")
+
+    def _fetch(self, url, params, format, headers=None, raw=False):
+        """GET a URL with retries; return the decoded body, or the response if raw."""
         for attempt in range(MAX_RETRIES):
             try:
-                response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=REQUEST_TIMEOUT
+                )
                 response.raise_for_status()
 
+                if raw:
+                    return response
                 if format == "json":
                     return response.json()
                 return response.text
@@ -91,6 +334,10 @@ class FEWSNETClient:
         product=None,
         market=None,
         limit=None,
+        window_months=None,
+        max_workers=FETCH_WORKERS,
+        columns=None,
+        dtypes=None,
     ):
         """
         Fetch market price data.
@@ -102,10 +349,28 @@ class FEWSNETClient:
             product: Filter by product name (e.g., 'Beans (Black)')
             market: Filter by market name (e.g., 'Port-au-Prince')
             limit: Maximum number of records to return
+            window_months: If set, split start_date..end_date into windows of
+                this many months and fetch them concurrently
+            max_workers: Number of concurrent requests for windowed fetches
+            columns: Columns to keep (e.g. SYNC_COLUMNS); None keeps all
+            dtypes: Dtype plan to apply (e.g. PRICE_DTYPES)
 
         Returns:
             pandas DataFrame with market price data
         """
+        if window_months and start_date:
+            return self._get_market_prices_windowed(
+                country_code=country_code,
+                start_date=start_date,
+                end_date=end_date or datetime.now().strftime("%Y-%m-%d"),
+                product=product,
+                market=market,
+                window_months=window_months,
+                max_workers=max_workers,
+                columns=columns,
+                dtypes=dtypes,
+            )
+
         params = {"country_code": country_code}
 
         if start_date:
@@ -123,7 +388,133 @@ class FEWSNETClient:
         print(f"       Parameters: {params}")
 
         json_data = self._make_request("marketpricefacts", params, format="json")
-        df = pd.DataFrame(json_data)
+        df = apply_column_plan(pd.DataFrame(json_data), columns, dtypes)
+
+        print(f"[OK] Retrieved {len(df)} records")
+        return df
+
+    def iter_market_prices(
+        self,
+        country_code="HT",
+        start_date=None,
+        end_date=None,
+        product=None,
+        market=None,
+        batch_size=STREAM_BATCH_SIZE,
+        columns=None,
+        dtypes=None,
+    ):
+        """
+        Stream market price data as DataFrames of at most batch_size records.
+
+        The endpoint's CSV format is read incrementally from the open response,
+        so peak memory is bounded by batch_size rather than the full payload.
+
+        Args:
+            country_code: ISO country code (default: 'HT' for Haiti)
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+            product: Filter by product name (e.g., 'Beans (Black)')
+            market: Filter by market name (e.g., 'Port-au-Prince')
+            batch_size: Records per yielded DataFrame
+            columns: Columns to parse (e.g. SYNC_COLUMNS); None parses all
+            dtypes: Dtype plan to apply to each batch (e.g. PRICE_DTYPES)
+
+        Yields:
+            pandas DataFrames with market price data
+        """
+        params = {"country_code": country_code, "format": "csv"}
+
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if product:
+            params["product"] = product
+        if market:
+            params["market"] = market
+
+        print(f"[INFO] Streaming market prices in batches of {batch_size}...")
+        print(f"       Parameters: {params}")
+
+        url = f"{BASE_URL}/marketpricefacts/"
+        with self.session.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            total = 0
+            try:
+                reader = pd.read_csv(
+                    response.raw,
+                    chunksize=batch_size,
+                    encoding="utf-8-sig",
+                    usecols=(lambda col: col in columns) if columns is not None else None,
+                )
+            except pd.errors.EmptyDataError:
+                print("[OK] Retrieved 0 records")
+                return
+
+            with reader:
+                for batch in reader:
+                    total += len(batch)
+                    print(f"[INFO] Received {total} records...")
+                    yield apply_column_plan(batch, dtypes=dtypes)
+
+        print(f"[OK] Retrieved {total} records")
+
+    def _get_market_prices_windowed(
+        self,
+        country_code,
+        start_date,
+        end_date,
+        product,
+        market,
+        window_months,
+        max_workers,
+        columns=None,
+        dtypes=None,
+    ):
+        """Fetch market prices as concurrent date windows, concatenated in date order."""
+        windows = date_windows(start_date, end_date, window_months)
+        base_params = {"country_code": country_code}
+        if product:
+            base_params["product"] = product
+        if market:
+            base_params["market"] = market
+
+        print(f"[INFO] Fetching market prices in {len(windows)} windows "
+              f"of {window_months} months ({max_workers} workers)...")
+        print(f"       Parameters: {base_params}")
+
+        def fetch_window(window):
+            params = dict(base_params, start_date=window[0], end_date=window[1])
+            json_data = self._make_request("marketpricefacts", params, format="json")
+            return apply_column_plan(pd.DataFrame(json_data), columns, dtypes)
+
+        frames = [None] * len(windows)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(fetch_window, window): i
+                for i, window in enumerate(windows)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                window_start, window_end = windows[i]
+                try:
+                    frames[i] = future.result()
+                except Exception as e:
+                    for pending in futures:
+                        pending.cancel()
+                    raise RuntimeError(
+                        f"Window {window_start} to {window_end} failed: {e}"
+                    ) from e
+                print(f"[INFO] {done}/{len(windows)} windows done "
+                      f"({window_start} to {window_end}: {len(frames[i])} records)")
+
+        frames = [frame for frame in frames if not frame.empty]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        # Categories differ between windows, so concat falls back to object
+        df = apply_column_plan(df, dtypes=dtypes)
 
         print(f"[OK] Retrieved {len(df)} records")
         return df
@@ -167,8 +558,72 @@ class FEWSNETClient:
             return False
 
 
-def download_haiti_data(client, start_date=None, end_date=None, output_file=None):
-    """Download Haiti market price data."""
+def save_parquet_snapshot(df, output_dir):
+    """
+    Write price data as a zstd-compressed Parquet snapshot.
+
+    Files are hive-partitioned by product and year of period_date
+    (output_dir/product=.../year=.../data_0.parquet), so DuckDB and other
+    Parquet readers can prune to one commodity or year without scanning the
+    rest. Writing goes through DuckDB, which is already required for the
+    database sync, rather than adding pyarrow as a dependency.
+
+    Args:
+        df: DataFrame from get_market_prices (needs product and period_date)
+        output_dir: Snapshot directory; existing partitions are overwritten
+
+    Returns:
+        Path to the snapshot directory
+    """
+    import duckdb
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    target = str(output_dir).replace("'", "''")
+
+    con = duckdb.connect()
+    try:
+        con.register("snapshot", df)
+        con.execute(f"""
+            COPY (
+                SELECT *, year(TRY_CAST(period_date AS DATE)) AS year
+                FROM snapshot
+            ) TO '{target}' (
+                FORMAT PARQUET,
+                COMPRESSION {PARQUET_COMPRESSION},
+                PARTITION_BY (product, year),
+                OVERWRITE_OR_IGNORE
+            )
+        """)
+    finally:
+        con.close()
+
+    return output_dir
+
+
+def save_prices(df, stem, output_format="csv"):
+    """Save price data under OUTPUT_DIR as a CSV file or Parquet snapshot directory."""
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    if output_format == "parquet":
+        return save_parquet_snapshot(df, OUTPUT_DIR / stem)
+
+    output_file = OUTPUT_DIR / f"{stem}.csv"
+    df.to_csv(output_file, index=False, encoding="utf-8-sig")
+    return output_file
+
+
+def download_haiti_data(client, start_date=None, end_date=None, output_file=None,
+                        output_format="csv"):
+    """
+    Download Haiti market price data.
+
+    Args:
+        client: FEWSNETClient instance
+        start_date: Start date (YYYY-MM-DD format), default 2005-01-01
+        end_date: End date (YYYY-MM-DD format), default today
+        output_file: CSV file or Parquet snapshot directory to write
+        output_format: 'csv' or 'parquet' (zstd, partitioned by product/year)
+    """
 
     if end_date is None:
         end_date = datetime.now().strftime("%Y-%m-%d")
@@ -184,6 +639,7 @@ def download_haiti_data(client, start_date=None, end_date=None, output_file=None
         country_code=COUNTRY_CODE,
         start_date=start_date,
         end_date=end_date,
+        dtypes=PRICE_DTYPES,
     )
 
     if df.empty:
@@ -209,18 +665,18 @@ def download_haiti_data(client, start_date=None, end_date=None, output_file=None
             print(f"  - {market}: {count} records")
 
     if "period_date" in df.columns:
-        df["period_date"] = pd.to_datetime(df["period_date"])
         print(f"\nDate range in data:")
         print(f"  Earliest: {df['period_date'].min().strftime('%Y-%m-%d')}")
         print(f"  Latest: {df['period_date'].max().strftime('%Y-%m-%d')}")
 
-    # Save to CSV
+    # Save to CSV or Parquet
     if output_file is None:
-        OUTPUT_DIR.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d")
-        output_file = OUTPUT_DIR / f"haiti_fewsnet_prices_{timestamp}.csv"
-
-    df.to_csv(output_file, index=False, encoding="utf-8-sig")
+        output_file = save_prices(df, f"haiti_fewsnet_prices_{timestamp}", output_format)
+    elif output_format == "parquet":
+        save_parquet_snapshot(df, output_file)
+    else:
+        df.to_csv(output_file, index=False, encoding="utf-8-sig")
     print(f"\n[OK] Data saved to: {output_file}")
 
     return df
@@ -277,13 +733,19 @@ def main():
 
     choice = input("\nSelect option (1-6): ").strip()
 
+    output_format = "csv"
+    if choice in ("1", "2", "4", "5"):
+        answer = input("Output format - csv or parquet [csv]: ").strip().lower()
+        output_format = "parquet" if answer == "parquet" else "csv"
+
     if choice == "1":
-        download_haiti_data(client)
+        download_haiti_data(client, output_format=output_format)
 
     elif choice == "2":
         start = input("Start date (YYYY-MM-DD): ").strip()
         end = input("End date (YYYY-MM-DD): ").strip()
-        download_haiti_data(client, start_date=start, end_date=end)
+        download_haiti_data(client, start_date=start, end_date=end,
+                            output_format=output_format)
 
     elif choice == "3":
         explore_available_data(client)
@@ -293,10 +755,8 @@ def main():
         product = input("\nEnter commodity name (exact match): ").strip()
         df = client.get_market_prices(product=product)
         if not df.empty:
-            OUTPUT_DIR.mkdir(exist_ok=True)
             safe_name = product.replace(" ", "_").replace("(", "").replace(")", "")
-            output_file = OUTPUT_DIR / f"haiti_{safe_name}.csv"
-            df.to_csv(output_file, index=False, encoding="utf-8-sig")
+            output_file = save_prices(df, f"haiti_{safe_name}", output_format)
             print(f"[OK] Saved to: {output_file}")
 
     elif choice == "5":
@@ -304,10 +764,8 @@ def main():
         market = input("\nEnter market name (exact match): ").strip()
         df = client.get_market_prices(market=market)
         if not df.empty:
-            OUTPUT_DIR.mkdir(exist_ok=True)
             safe_name = market.replace(" ", "_").replace(",", "")
-            output_file = OUTPUT_DIR / f"haiti_{safe_name}.csv"
-            df.to_csv(output_file, index=False, encoding="utf-8-sig")
+            output_file = save_prices(df, f"haiti_{safe_name}", output_format)
             print(f"[OK] Saved to: {output_file}")
 
     elif choice == "6":
@@ -11,9 +11,48 @@ Usage:
     # Full sync (all historical data from 2005)
     python sync_fews_db.py --full
 
+    # Checkpointed full sync; after an interruption, continue where it stopped
+    python sync_fews_db.py --full --checkpoint
+    python sync_fews_db.py --full --resume
+
     # Incremental sync (only new data since last sync)
     python sync_fews_db.py --sync
 
+    # Sync Haiti and the Dominican Republic concurrently into the same database
+    python sync_fews_db.py --full --countries HT,DO
+
+    # Use the set-based bulk ingest path (much faster for large syncs)
+    python sync_fews_db.py --full --bulk
+
+    # Commit every 5000 rows in its own transaction
+    python sync_fews_db.py --full --batch-size 5000
+
+    # Fetch the history as concurrent 12-month windows
+    python sync_fews_db.py --full --window-months 12 --workers 4
+
+    # Same, using the asyncio client (requires aiohttp)
+    python sync_fews_db.py --full --async --window-months 12
+
+    # Stream the response as CSV and ingest 10000 records at a time
+    python sync_fews_db.py --full --stream 10000
+
+    # Load a Parquet snapshot written by fewsnet_haiti_downloader.py
+    python sync_fews_db.py --load-parquet data/haiti_fewsnet_prices_20250101
+
+    # Incremental sync of records revised since the last sync (any period)
+    python sync_fews_db.py --sync --modified
+
+    # Sync into a staging copy and swap it in, so the dashboard keeps working
+    python sync_fews_db.py --sync --staged
+
+    # Store observations clustered by product/market/date; re-cluster after syncs
+    python sync_fews_db.py --init --layout clustered
+    python sync_fews_db.py --recluster
+
+    # Precompute dashboard forecasts by hand (every successful sync does this at the end)
+    python sync_fews_db.py --forecasts
+    python sync_fews_db.py --sync --no-forecasts
+
     # Show database statistics
     python sync_fews_db.py --stats
 
@@ -25,37 +64,144 @@ Requirements:
 """
 
 import argparse
+import asyncio
+import importlib.util
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+
+import pandas as pd
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from database.fews_database import FEWSDatabase
-from fewsnet_haiti_downloader import FEWSNETClient
+from database.fews_database import (
+    LAYOUTS,
+    SYNC_COLUMNS,
+    DatabaseLockedError,
+    FEWSDatabase,
+    open_writer,
+)
+from fewsnet_haiti_downloader import (
+    FETCH_WORKERS,
+    PRICE_DTYPES,
+    STREAM_BATCH_SIZE,
+    FEWSNETClient,
+    apply_column_plan,
+    date_windows,
+)
+
+CHECKPOINT_WINDOW_MONTHS = 12  # Default fetch window for checkpointed syncs
+CHECKPOINT_BATCH_SIZE = 5000  # Default rows per checkpointed transaction
+FORECAST_CURRENCIES = ["HTG", "USD"]  # Currencies precomputed for the dashboard
+FORECAST_MONTHS = 8  # Months ahead stored (the dashboard's longest horizon)
+
+
+def import_status(stats: dict):
+    """Return the (status, error_message) to log for a sync's stats."""
+    if stats.get("stream_error"):
+        return "partial", f"Stream interrupted: {stats['stream_error']}"
+    if stats.get("failed_batches"):
+        return "partial", f"{stats['failed_batches']} batch(es) rolled back"
+    return "success", None
+
+
+def imported_changes(status: str, stats: dict) -> bool:
+    """Whether a sync succeeded and stored new or revised rows."""
+    return status == "success" and bool(stats.get("inserted") or stats.get("updated"))
+
+
+def print_sync_summary(records_fetched: int, stats: dict):
+    """Print the summary block shown at the end of a sync."""
+    print(f"\n{'='*60}")
+    print("Sync Complete")
+    print(f"{'='*60}")
+    print(f"  Records fetched:  {records_fetched}")
+    print(f"  Records inserted: {stats['inserted']}")
+    print(f"  Records updated:  {stats['updated']}")
+    print(f"  Records skipped:  {stats['skipped']} (unchanged)")
+    print(f"  Errors:           {stats['errors']}")
+    if stats.get("failed_batches"):
+        print(f"  Failed batches:   {stats['failed_batches']} (import logged as partial)")
+    if stats.get("stream_error"):
+        print(f"  Stream error:     {stats['stream_error']} (import logged as partial)")
+
+
+def changed_since(df, high_water):
+    """
+    Keep the rows whose API 'modified' timestamp is newer than high_water.
+
+    Rows without a 'modified' timestamp cannot be compared, so they are kept
+    (change detection skips them if they are already stored).
+    """
+    if high_water is None or df.empty:
+        return df
+    undated = df["modified"].isna()
+    if undated.any():
+        print(f"[INFO] {undated.sum()} records without a 'modified' timestamp, syncing them")
+    return df[undated | (df["modified"] > high_water)]
+
 
+def changed_batches(batches, high_water, marks: list):
+    """Filter streamed batches to changed rows, recording each batch's newest 'modified'."""
+    for batch in batches:
+        delta = changed_since(batch, high_water)
+        if delta.empty:
+            continue
+        marks.append(delta["modified"].max())
+        yield delta
 
-def init_database():
-    """Initialize the database with schema."""
+
+def fetch_prices_async(start_date: str, end_date: str,
+                       window_months: Optional[int], workers: int):
+    """Fetch price data as concurrent windows with the asyncio client."""
+    # Imported here so aiohttp is only needed for --async
+    from fewsnet_async_client import AsyncFEWSNETClient
+
+    async def fetch():
+        async with AsyncFEWSNETClient(max_connections=workers) as client:
+            return await client.get_market_prices_windowed(
+                start_date, end_date, window_months=window_months or 12
+            )
+
+    return apply_column_plan(asyncio.run(fetch()), SYNC_COLUMNS, PRICE_DTYPES)
+
+
+def init_database(layout: Optional[str] = None):
+    """Initialize the database with schema (optionally switching storage layout)."""
     print("=" * 60)
     print("Initializing FEWS NET Database")
     print("=" * 60)
 
-    with FEWSDatabase() as db:
-        db.create_tables()
+    with open_writer() as db:
+        db.create_tables(layout=layout)
         print("[OK] Database initialized successfully")
         print(f"     Location: {db.db_path}")
 
 
-def full_sync():
-    """Perform a full sync of all historical data."""
+def full_sync(bulk: bool = False, batch_size: Optional[int] = None,
+              window_months: Optional[int] = None, workers: int = FETCH_WORKERS,
+              use_async: bool = False, stream_batch: Optional[int] = None,
+              use_cache: bool = True, staged: bool = False, forecasts: bool = False):
+    """
+    Perform a full sync of all historical data.
+
+    With forecasts, forecasts are precomputed in the same writer session
+    after a successful import (see store_stale_forecasts).
+
+    Returns:
+        Import status logged ('success' or 'partial'), or None if no data
+        was retrieved
+    """
     print("=" * 60)
     print("Full Sync - All Historical Data")
     print("=" * 60)
 
     # Initialize API client
-    client = FEWSNETClient()
+    client = FEWSNETClient(use_cache=use_cache)
     if not client.test_connection():
         print("[ERROR] Could not connect to FEWS NET API")
         sys.exit(1)
@@ -67,48 +213,75 @@ def full_sync():
     print(f"\n[INFO] Fetching data from {start_date} to {end_date}...")
     print("       This may take several minutes for large datasets.\n")
 
-    try:
-        df = client.get_market_prices(
-            country_code="HT",
-            start_date=start_date,
-            end_date=end_date,
-        )
-    except Exception as e:
-        print(f"[ERROR] Failed to fetch data: {e}")
-        sys.exit(1)
+    df = None
+    if not stream_batch:
+        try:
+            if use_async:
+                df = fetch_prices_async(start_date, end_date, window_months, workers)
+            else:
+                df = client.get_market_prices(
+                    country_code="HT",
+                    start_date=start_date,
+                    end_date=end_date,
+                    window_months=window_months,
+                    max_workers=workers,
+                    columns=SYNC_COLUMNS,
+                    dtypes=PRICE_DTYPES,
+                )
+        except Exception as e:
+            print(f"[ERROR] Failed to fetch data: {e}")
+            sys.exit(1)
 
-    if df.empty:
-        print("[WARN] No data retrieved from API")
-        return
+        if df.empty:
+            print("[WARN] No data retrieved from API")
+            return None
 
-    print(f"[OK] Fetched {len(df)} records from API")
+        print(f"[OK] Fetched {len(df)} records from API")
 
     # Sync to database
     print("\n[INFO] Syncing to database...")
 
-    with FEWSDatabase() as db:
+    with open_writer(staged=staged) as db:
         # Ensure tables exist
         db.create_tables()
 
         # Sync data
-        stats = db.sync_dataframe(df)
+        if stream_batch:
+            batches = client.iter_market_prices(
+                country_code="HT",
+                start_date=start_date,
+                end_date=end_date,
+                batch_size=stream_batch,
+                columns=SYNC_COLUMNS,
+                dtypes=PRICE_DTYPES,
+            )
+            marks = []
+            stats = db.sync_batches(changed_batches(batches, None, marks),
+                                    bulk=bulk, batch_size=batch_size)
+            records_fetched = stats["fetched"]
+        else:
+            stats = db.sync_dataframe(df, bulk=bulk, batch_size=batch_size)
+            records_fetched = len(df)
+            marks = [df["modified"].max()]
+        status, error_message = import_status(stats)
+        db.refresh_aggregates()
 
         # Log the import
         db.log_import(
-            records_fetched=len(df),
+            records_fetched=records_fetched,
             stats=stats,
             start_date=start_date,
             end_date=end_date,
-            status="success"
+            status=status,
+            error_message=error_message,
         )
 
-        print(f"\n{'='*60}")
-        print("Sync Complete")
-        print(f"{'='*60}")
-        print(f"  Records fetched:  {len(df)}")
-        print(f"  Records inserted: {stats['inserted']}")
-        print(f"  Records updated:  {stats['updated']}")
-        print(f"  Errors:           {stats['errors']}")
+        # A complete full sync covers every period, so later --sync --modified runs start here
+        marks = [mark for mark in marks if not pd.isna(mark)]
+        if status == "success" and marks:
+            db.set_modified_high_water("HT", max(marks))
+
+        print_sync_summary(records_fetched, stats)
 
         # Show final stats
         db_stats = db.get_stats()
@@ -118,37 +291,354 @@ def full_sync():
         print(f"    Products:     {db_stats['total_products']}")
         print(f"    Date range:   {db_stats['date_min']} to {db_stats['date_max']}")
 
+        if forecasts and imported_changes(status, stats):
+            print()
+            store_stale_forecasts(db)
+
+    return status
+
+
+def checkpointed_full_sync(bulk: bool = False, batch_size: Optional[int] = None,
+                           window_months: Optional[int] = None, resume: bool = False,
+                           use_cache: bool = True, forecasts: bool = False):
+    """
+    Perform a full sync that can be resumed after an interruption.
 
-def incremental_sync():
-    """Perform an incremental sync (only new data since last sync)."""
+    The history is fetched one date window at a time and ingested in batches.
+    Progress of each window and each completed window are recorded in
+    sync_checkpoints. With resume, completed windows are skipped and an
+    unfinished window is synced again from its start: the API may return
+    different rows after a revision, so row offsets cannot be trusted, and
+    rows already stored are skipped as unchanged.
+
+    Returns:
+        Import status logged ('success' or 'partial'); forecasts are
+        precomputed after a successful import when forecasts is set
+    """
     print("=" * 60)
-    print("Incremental Sync")
+    print("Full Sync - Checkpointed")
     print("=" * 60)
 
-    with FEWSDatabase() as db:
+    batch_size = batch_size or CHECKPOINT_BATCH_SIZE
+
+    # Initialize API client
+    client = FEWSNETClient(use_cache=use_cache)
+    if not client.test_connection():
+        print("[ERROR] Could not connect to FEWS NET API")
+        sys.exit(1)
+
+    with open_writer() as db:
         # Ensure tables exist
         db.create_tables()
 
-        # Get last sync date
-        last_sync = db.get_last_sync_date()
+        checkpoints = db.get_checkpoint_run() if resume else None
+        if checkpoints:
+            done = sum(checkpoint["completed"] for checkpoint in checkpoints)
+            print(f"[INFO] Resuming: {done}/{len(checkpoints)} windows already synced")
+        else:
+            if resume:
+                print("[INFO] No interrupted sync found, starting a new one")
+            windows = date_windows("2005-01-01", datetime.now().strftime("%Y-%m-%d"),
+                                   window_months or CHECKPOINT_WINDOW_MONTHS)
+            checkpoints = db.start_checkpoint_run(windows)
+
+        start_date = checkpoints[0]["window_start"]
+        end_date = checkpoints[-1]["window_end"]
+        stats = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0,
+                 "failed_batches": 0}
+        records_fetched = 0
+
+        for num, checkpoint in enumerate(checkpoints, start=1):
+            if checkpoint["completed"]:
+                continue
+            window_start = checkpoint["window_start"]
+
+            print(f"\n[INFO] Window {num}/{len(checkpoints)}: "
+                  f"{window_start} to {checkpoint['window_end']}")
+            try:
+                df = client.get_market_prices(
+                    country_code="HT",
+                    start_date=window_start,
+                    end_date=checkpoint["window_end"],
+                    columns=SYNC_COLUMNS,
+                    dtypes=PRICE_DTYPES,
+                )
+            except Exception as e:
+                print(f"[ERROR] Failed to fetch data: {e}")
+                db.log_import(
+                    records_fetched=records_fetched,
+                    stats=stats,
+                    start_date=start_date,
+                    end_date=end_date,
+                    status="failed",
+                    error_message=str(e),
+                )
+                print("[INFO] Progress is checkpointed; re-run with --full --resume")
+                sys.exit(1)
+
+            records_fetched += len(df)
+            if checkpoint["rows_ingested"]:
+                print(f"[INFO] Re-syncing window; {checkpoint['rows_ingested']} rows "
+                      "stored before the interruption will be skipped as unchanged")
 
-        if last_sync:
-            # Start from the day after last sync
-            start_date = (datetime.strptime(last_sync, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
-            print(f"[INFO] Last sync: {last_sync}")
-            print(f"[INFO] Fetching data from {start_date}")
+            window_stats = db.sync_dataframe_batched(
+                df, batch_size, bulk=bulk,
+                checkpoint=lambda rows: db.save_checkpoint(window_start, rows),
+            )
+            for key, count in window_stats.items():
+                stats[key] += count
+
+            if not window_stats["failed_batches"]:
+                db.save_checkpoint(window_start, len(df), completed=True)
+
+        status, error_message = import_status(stats)
+        db.refresh_aggregates()
+
+        # Log the import
+        db.log_import(
+            records_fetched=records_fetched,
+            stats=stats,
+            start_date=start_date,
+            end_date=end_date,
+            status=status,
+            error_message=error_message,
+        )
+
+        # Windows finished in earlier attempts are already stored, so take the mark from the table
+        high_water = db.get_stored_modified_max("HT")
+        if status == "success" and high_water is not None:
+            db.set_modified_high_water("HT", high_water)
+
+        print_sync_summary(records_fetched, stats)
+        if status != "success":
+            print("\n[INFO] Re-run with --full --resume to retry the failed batches")
+
+        if forecasts and imported_changes(status, stats):
+            print()
+            store_stale_forecasts(db)
+
+    return status
+
+
+def multi_country_sync(countries: list, incremental: bool = False, bulk: bool = False,
+                       batch_size: Optional[int] = None, window_months: Optional[int] = None,
+                       workers: int = FETCH_WORKERS, use_cache: bool = True,
+                       by_modified: bool = False, staged: bool = False,
+                       forecasts: bool = False):
+    """
+    Sync several countries into the shared database.
+
+    Every country's data is fetched concurrently. Each result is ingested as
+    soon as its fetch finishes, on the single database connection, while the
+    other fetches continue. Wall time is therefore close to the slowest
+    country's fetch plus one ingest, not the sum. Each country gets its own
+    import_log row.
+
+    Args:
+        countries: ISO country codes, e.g. ['HT', 'DO']
+        incremental: Fetch only periods after each country's last sync
+            (or, with by_modified, records revised since its high-water mark)
+        bulk, batch_size: Ingest options, as for full_sync
+        window_months, workers: Windowed fetch options applied per country
+        use_cache: Use the on-disk API response cache
+        by_modified: With incremental, key each country on the API 'modified' field
+        staged: Write to a staging copy and swap it into place (see open_writer)
+        forecasts: Precompute forecasts in the same writer session if every
+            country synced successfully
+
+    Returns:
+        'success' if every synced country succeeded, otherwise 'partial' (or
+        'failed' if none did); None if every country was up to date
+    """
+    print("=" * 60)
+    print(f"{'Incremental' if incremental else 'Full'} Sync - {', '.join(countries)}")
+    print("=" * 60)
+
+    # Initialize API client (one pooled session shared by all fetch threads)
+    client = FEWSNETClient(use_cache=use_cache)
+    if not client.test_connection():
+        print("[ERROR] Could not connect to FEWS NET API")
+        sys.exit(1)
+
+    end_date = datetime.now().strftime("%Y-%m-%d")
+    results = {}
+
+    with open_writer(staged=staged) as db:
+        # Ensure tables exist
+        db.create_tables()
+
+        start_dates = {}
+        high_waters = {}
+        for country in countries:
+            start_date = "2005-01-01"
+            if incremental and by_modified:
+                high_waters[country] = db.get_modified_high_water(country)
+            elif incremental:
+                last_sync = db.get_last_sync_date(country)
+                if last_sync:
+                    start_date = (datetime.strptime(last_sync, "%Y-%m-%d")
+                                  + timedelta(days=1)).strftime("%Y-%m-%d")
+            if start_date > end_date:
+                print(f"[INFO] {country}: up to date, nothing to sync")
+                continue
+            start_dates[country] = start_date
+            print(f"[INFO] {country}: fetching {start_date} to {end_date}")
+
+        if not start_dates:
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(start_dates)) as executor:
+            futures = {
+                executor.submit(
+                    client.get_market_prices,
+                    country_code=country,
+                    start_date=start_date,
+                    end_date=end_date,
+                    window_months=window_months,
+                    max_workers=workers,
+                    columns=SYNC_COLUMNS,
+                    dtypes=PRICE_DTYPES,
+                ): country
+                for country, start_date in start_dates.items()
+            }
+
+            for future in as_completed(futures):
+                country = futures[future]
+                start_date = start_dates[country]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    print(f"[ERROR] {country}: failed to fetch data: {e}")
+                    db.log_import(
+                        records_fetched=0,
+                        stats={},
+                        start_date=start_date,
+                        end_date=end_date,
+                        status="failed",
+                        error_message=str(e),
+                        country_code=country,
+                    )
+                    results[country] = ("failed", 0, {})
+                    continue
+
+                if incremental and by_modified and not df.empty:
+                    df = changed_since(df, high_waters[country])
+
+                print(f"\n[INFO] {country}: syncing {len(df)} records to database...")
+                if df.empty:
+                    stats = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+                else:
+                    stats = db.sync_dataframe(df, bulk=bulk, batch_size=batch_size)
+                status, error_message = import_status(stats)
+
+                db.log_import(
+                    records_fetched=len(df),
+                    stats=stats,
+                    start_date=start_date,
+                    end_date=end_date,
+                    status=status,
+                    error_message=error_message,
+                    country_code=country,
+                )
+
+                # Plain incremental syncs skip older periods, so they must not move the mark
+                high_water = df["modified"].max() if not df.empty else None
+                if status == "success" and not pd.isna(high_water) and (
+                        not incremental or by_modified):
+                    db.set_modified_high_water(country, high_water)
+
+                results[country] = (status, len(df), stats)
+
+        db.refresh_aggregates()
+
+        statuses = [status for status, _, _ in results.values()]
+        if all(status == "success" for status in statuses):
+            overall = "success"
+        elif "success" in statuses or "partial" in statuses:
+            overall = "partial"
         else:
-            print("[INFO] No previous sync found, performing full sync")
+            overall = "failed"
+
+        if forecasts and any(
+                imported_changes(overall, stats) for _, _, stats in results.values()):
+            print()
+            store_stale_forecasts(db)
+
+    print(f"\n{'='*60}")
+    print("Sync Complete")
+    print(f"{'='*60}")
+    print(f"  {'Country':<8} {'Status':<8} {'Fetched':>8} {'Inserted':>9} "
+          f"{'Updated':>8} {'Skipped':>8} {'Errors':>7}")
+    for country in countries:
+        if country not in results:
+            continue
+        status, fetched, stats = results[country]
+        print(f"  {country:<8} {status:<8} {fetched:>8} {stats.get('inserted', 0):>9} "
+              f"{stats.get('updated', 0):>8} {stats.get('skipped', 0):>8} "
+              f"{stats.get('errors', 0):>7}")
+
+    return overall
+
+
+def incremental_sync(bulk: bool = False, batch_size: Optional[int] = None,
+                     window_months: Optional[int] = None, workers: int = FETCH_WORKERS,
+                     use_async: bool = False, stream_batch: Optional[int] = None,
+                     use_cache: bool = True, by_modified: bool = False,
+                     staged: bool = False, forecasts: bool = False):
+    """
+    Perform an incremental sync.
+
+    By default only periods after the last successful sync are fetched. With
+    by_modified, every period is requested, but only records whose API
+    'modified' timestamp is newer than the stored high-water mark are synced.
+    This captures revisions to older periods as well as new data.
+
+    With forecasts, forecasts are precomputed in the same writer session
+    after a successful import that stored new or revised rows.
+
+    Returns:
+        Import status logged ('success' or 'partial'), or None if the
+        database was already up to date
+    """
+    print("=" * 60)
+    print("Incremental Sync" + (" - Revised Records" if by_modified else ""))
+    print("=" * 60)
+
+    with open_writer(staged=staged) as db:
+        # Ensure tables exist
+        db.create_tables()
+
+        high_water = None
+        if by_modified:
+            # Revisions can touch any period, so the date window is the full history
             start_date = "2005-01-01"
+            high_water = db.get_modified_high_water("HT")
+            if high_water is not None:
+                print(f"[INFO] Modified high-water mark: {high_water}")
+                print("[INFO] Syncing records revised since then, across all periods")
+            else:
+                print("[INFO] No previous sync found, performing full sync")
+        else:
+            # Get last sync date
+            last_sync = db.get_last_sync_date()
+
+            if last_sync:
+                # Start from the day after last sync
+                start_date = (datetime.strptime(last_sync, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+                print(f"[INFO] Last sync: {last_sync}")
+                print(f"[INFO] Fetching data from {start_date}")
+            else:
+                print("[INFO] No previous sync found, performing full sync")
+                start_date = "2005-01-01"
 
         end_date = datetime.now().strftime("%Y-%m-%d")
 
         if start_date > end_date:
             print("[INFO] Database is up to date, nothing to sync")
-            return
+            return None
 
         # Initialize API client
-        client = FEWSNETClient()
+        client = FEWSNETClient(use_cache=use_cache)
         if not client.test_connection():
             print("[ERROR] Could not connect to FEWS NET API")
             sys.exit(1)
@@ -156,12 +646,34 @@ def incremental_sync():
         # Fetch new data
         print(f"\n[INFO] Fetching data from {start_date} to {end_date}...")
 
+        marks = []
         try:
-            df = client.get_market_prices(
-                country_code="HT",
-                start_date=start_date,
-                end_date=end_date,
-            )
+            if stream_batch:
+                batches = client.iter_market_prices(
+                    country_code="HT",
+                    start_date=start_date,
+                    end_date=end_date,
+                    batch_size=stream_batch,
+                    columns=SYNC_COLUMNS,
+                    dtypes=PRICE_DTYPES,
+                )
+                if by_modified:
+                    batches = changed_batches(batches, high_water, marks)
+                print("\n[INFO] Syncing to database as batches arrive...")
+                stats = db.sync_batches(batches, bulk=bulk, batch_size=batch_size)
+                df = None
+            elif use_async:
+                df = fetch_prices_async(start_date, end_date, window_months, workers)
+            else:
+                df = client.get_market_prices(
+                    country_code="HT",
+                    start_date=start_date,
+                    end_date=end_date,
+                    window_months=window_months,
+                    max_workers=workers,
+                    columns=SYNC_COLUMNS,
+                    dtypes=PRICE_DTYPES,
+                )
         except Exception as e:
             print(f"[ERROR] Failed to fetch data: {e}")
             db.log_import(
@@ -174,7 +686,14 @@ def incremental_sync():
             )
             sys.exit(1)
 
-        if df.empty:
+        if by_modified and df is not None and not df.empty:
+            fetched = len(df)
+            df = changed_since(df, high_water)
+            print(f"[INFO] {len(df)} of {fetched} records changed since the last sync")
+            if not df.empty:
+                marks.append(df["modified"].max())
+
+        if df is not None and df.empty:
             print("[INFO] No new data available")
             db.log_import(
                 records_fetched=0,
@@ -183,30 +702,189 @@ def incremental_sync():
                 end_date=end_date,
                 status="success"
             )
-            return
+            return "success"
 
-        print(f"[OK] Fetched {len(df)} records")
+        if df is not None:
+            print(f"[OK] Fetched {len(df)} records")
 
-        # Sync data
-        print("\n[INFO] Syncing to database...")
-        stats = db.sync_dataframe(df)
+            # Sync data
+            print("\n[INFO] Syncing to database...")
+            stats = db.sync_dataframe(df, bulk=bulk, batch_size=batch_size)
+            records_fetched = len(df)
+        else:
+            records_fetched = stats["fetched"]
+        status, error_message = import_status(stats)
+        db.refresh_aggregates()
 
         # Log the import
         db.log_import(
-            records_fetched=len(df),
+            records_fetched=records_fetched,
             stats=stats,
             start_date=start_date,
             end_date=end_date,
-            status="success"
+            status=status,
+            error_message=error_message,
+        )
+
+        # Only a complete sync may advance the mark, or skipped rows would be lost
+        marks = [mark for mark in marks if not pd.isna(mark)]
+        if by_modified and status == "success" and marks:
+            db.set_modified_high_water("HT", max(marks))
+            print(f"[OK] Modified high-water mark advanced to {max(marks)}")
+
+        print_sync_summary(records_fetched, stats)
+
+        if forecasts and imported_changes(status, stats):
+            print()
+            store_stale_forecasts(db)
+
+    return status
+
+
+def load_parquet(path: str, staged: bool = False, forecasts: bool = False):
+    """
+    Load a Parquet snapshot written by fewsnet_haiti_downloader.py.
+
+    With forecasts, forecasts are precomputed in the same writer session
+    after a successful import (see store_stale_forecasts).
+
+    Returns:
+        Import status logged
+    """
+    print("=" * 60)
+    print("Load Parquet Snapshot")
+    print("=" * 60)
+
+    if not Path(path).exists() and not any(ch in path for ch in "*?["):
+        print(f"[ERROR] Snapshot not found: {path}")
+        sys.exit(1)
+
+    print(f"\n[INFO] Loading {path}...")
+
+    with open_writer(staged=staged) as db:
+        db.create_tables()
+
+        try:
+            stats = db.sync_parquet(path)
+        except Exception as e:
+            print(f"[ERROR] Failed to load snapshot: {e}")
+            sys.exit(1)
+
+        status, error_message = import_status(stats)
+        db.refresh_aggregates()
+        db.log_import(
+            records_fetched=stats["fetched"],
+            stats=stats,
+            start_date=stats["start_date"],
+            end_date=stats["end_date"],
+            status=status,
+            error_message=error_message,
         )
 
-        print(f"\n{'='*60}")
-        print("Sync Complete")
-        print(f"{'='*60}")
-        print(f"  Records fetched:  {len(df)}")
-        print(f"  Records inserted: {stats['inserted']}")
-        print(f"  Records updated:  {stats['updated']}")
-        print(f"  Errors:           {stats['errors']}")
+        print_sync_summary(stats["fetched"], stats)
+
+        if forecasts and imported_changes(status, stats):
+            print()
+            store_stale_forecasts(db)
+
+    return status
+
+
+def recluster(staged: bool = False):
+    """Rewrite price_observations in clustered order."""
+    with open_writer(staged=staged) as db:
+        db.create_tables()
+        db.recluster()
+
+
+def refresh_aggregates():
+    """Rebuild aggregate partitions touched since the last refresh."""
+    with open_writer() as db:
+        db.create_tables()
+        db.refresh_aggregates()
+
+
+def precompute_forecasts(staged: bool = False, refit: bool = False):
+    """
+    Precompute forecasts for products with newly imported data (--forecasts).
+
+    Args:
+        staged: Write to a staging copy and swap it into place (see open_writer)
+        refit: Ignore the fitted-model cache and fit every model again
+    """
+    with open_writer(staged=staged) as db:
+        db.create_tables()
+        store_stale_forecasts(db, refit=refit)
+
+
+def store_stale_forecasts(db: FEWSDatabase, refit: bool = False):
+    """
+    Fit forecasts for products with newly imported data and store them.
+
+    Runs fit_all_models and generate_all_forecasts from the dashboard's
+    forecasting module for every such product in each of FORECAST_CURRENCIES
+    and writes the results to the forecasts and forecast_models tables, which
+    the dashboard reads. The fast baseline is always stored; Prophet forecasts
+    are stored too when Prophet is installed.
+
+    Args:
+        db: Open database from open_writer (the sync's own session, so a
+            staged sync copies and swaps the database only once)
+        refit: Ignore the fitted-model cache and fit every model again
+    """
+    print("=" * 60)
+    print("Precomputing Forecasts")
+    print("=" * 60)
+
+    try:
+        from dashboard.forecasting import (
+            fit_all_models,
+            forecast_tables,
+            generate_all_forecasts,
+        )
+    except ImportError as e:
+        print(f"[WARN] Skipping forecasts, forecasting dependencies missing: {e}")
+        print("       pip install -r dashboard/requirements.txt")
+        return
+
+    backends = ["fast"]
+    if importlib.util.find_spec("prophet") is not None:
+        backends.append("prophet")
+    else:
+        print("[WARN] Prophet not installed, storing fast baseline forecasts only")
+
+    started = db.con.execute(
+        "SELECT CAST(get_current_timestamp() AS TIMESTAMP)"
+    ).fetchone()[0]
+
+    products = db.get_stale_forecast_products()
+    if not products:
+        print("[OK] Forecasts are up to date")
+        return
+    print(f"[INFO] {len(products)} product(s) with new data")
+
+    start = time.perf_counter()
+    for i, product in enumerate(products, 1):
+        fitted = 0
+        for currency in FORECAST_CURRENCIES:
+            for backend in backends:
+                results, availability = fit_all_models(
+                    str(db.db_path), product, currency=currency, refit=refit,
+                    con=db.con, backend=backend
+                )
+                forecasts = generate_all_forecasts(results, periods=FORECAST_MONTHS)
+                forecast_rows, model_rows = forecast_tables(
+                    results, availability, forecasts
+                )
+                db.store_forecasts(
+                    product, currency, forecast_rows, model_rows, model=backend
+                )
+                fitted += len(forecasts)
+        print(f"[INFO] {i}/{len(products)} {product}: {fitted} forecasts")
+
+    db.mark_forecasts_refreshed(started)
+    print(f"[OK] Forecasts stored for {len(products)} product(s) "
+          f"in {time.perf_counter() - start:.1f}s")
 
 
 def show_stats():
@@ -239,14 +917,15 @@ def show_stats():
             # Show recent imports
             print("\n  Recent imports:")
             imports = db.query("""
-                SELECT import_date, records_fetched, records_inserted, status
+                SELECT import_date, records_fetched, records_inserted, records_skipped, status
                 FROM import_log
                 ORDER BY import_date DESC
                 LIMIT 5
             """)
             for _, row in imports.iterrows():
                 print(f"    {row['import_date']}: {row['records_fetched']} fetched, "
-                      f"{row['records_inserted']} inserted ({row['status']})")
+                      f"{row['records_inserted']} inserted, {row['records_skipped']} unchanged "
+                      f"({row['status']})")
 
     except Exception as e:
         print(f"[ERROR] {e}")
@@ -278,7 +957,29 @@ def main():
 Examples:
   python sync_fews_db.py --init          Initialize database
   python sync_fews_db.py --full          Full historical sync
+  python sync_fews_db.py --full --resume Resume an interrupted checkpointed full sync
   python sync_fews_db.py --sync          Incremental sync
+  python sync_fews_db.py --sync --countries HT,DO
+                                         Incremental sync of several countries concurrently
+  python sync_fews_db.py --sync --modified
+                                         Incremental sync of records revised since last sync
+  python sync_fews_db.py --full --bulk   Full sync using set-based ingest
+  python sync_fews_db.py --full --batch-size 5000
+                                         Full sync, one transaction per 5000 rows
+  python sync_fews_db.py --full --window-months 12
+                                         Full sync, fetched as concurrent 12-month windows
+  python sync_fews_db.py --full --async  Full sync using the asyncio client
+  python sync_fews_db.py --full --stream 10000
+                                         Full sync, ingesting 10000 streamed records at a time
+  python sync_fews_db.py --load-parquet data/haiti_fewsnet_prices_20250101
+                                         Load a Parquet snapshot directory
+  python sync_fews_db.py --sync --staged Incremental sync via a staging copy (readers never blocked)
+  python sync_fews_db.py --init --layout clustered
+                                         Switch to the sorted, index-free layout
+  python sync_fews_db.py --recluster     Re-sort observations after syncs
+  python sync_fews_db.py --forecasts     Precompute forecasts for products with new data
+  python sync_fews_db.py --sync --no-forecasts
+                                         Incremental sync without precomputing forecasts
   python sync_fews_db.py --stats         Show statistics
   python sync_fews_db.py --query "SELECT * FROM v_latest_prices"
         """
@@ -288,21 +989,113 @@ Examples:
     group.add_argument("--init", action="store_true", help="Initialize database schema")
     group.add_argument("--full", action="store_true", help="Full sync (all historical data)")
     group.add_argument("--sync", action="store_true", help="Incremental sync (new data only)")
+    group.add_argument("--load-parquet", type=str, metavar="PATH",
+                       help="Load a Parquet snapshot (directory, file or glob)")
+    group.add_argument("--recluster", action="store_true",
+                       help="Rewrite price_observations sorted by product, market and date")
+    group.add_argument("--refresh-aggregates", action="store_true",
+                       help="Refresh the materialized aggregate tables (runs after every sync)")
+    group.add_argument("--forecasts", action="store_true",
+                       help="Precompute dashboard forecasts for products with new data "
+                            "(runs after every sync)")
     group.add_argument("--stats", action="store_true", help="Show database statistics")
     group.add_argument("--query", type=str, metavar="SQL", help="Run a SQL query")
+    parser.add_argument("--layout", choices=LAYOUTS,
+                        help="With --init, store price_observations 'indexed' (secondary "
+                             "indexes, default) or 'clustered' (sorted, no secondary indexes)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Use set-based bulk ingest for --full/--sync")
+    parser.add_argument("--batch-size", type=int, metavar="N",
+                        help="Commit every N rows in its own transaction for --full/--sync")
+    parser.add_argument("--window-months", type=int, metavar="N",
+                        help="Fetch --full/--sync data as concurrent N-month windows")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS, metavar="N",
+                        help=f"Concurrent requests for --window-months (default: {FETCH_WORKERS})")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Fetch with the asyncio client (requires aiohttp; "
+                             "windows default to 12 months)")
+    parser.add_argument("--stream", type=int, nargs="?", const=STREAM_BATCH_SIZE, metavar="N",
+                        help="Stream --full/--sync data as CSV and ingest N records at a time "
+                             f"(default: {STREAM_BATCH_SIZE})")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="With --full, record progress per window and batch so the "
+                             "sync can be resumed")
+    parser.add_argument("--resume", action="store_true",
+                        help="With --full, resume the last interrupted checkpointed sync "
+                             "(starts a checkpointed sync if there is none)")
+    parser.add_argument("--modified", action="store_true",
+                        help="With --sync, sync records whose API 'modified' timestamp "
+                             "is newer than the last sync, including older periods")
+    parser.add_argument("--countries", type=str, metavar="CODES",
+                        help="With --full/--sync, comma-separated ISO country codes to "
+                             "fetch concurrently (e.g. HT,DO)")
+    parser.add_argument("--staged", action="store_true",
+                        help="Write --full/--sync/--load-parquet/--forecasts into a staging "
+                             "copy and swap it into place, so readers are never blocked")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk API response cache")
+    parser.add_argument("--no-forecasts", action="store_true",
+                        help="Do not precompute forecasts after --full/--sync/--load-parquet")
+    parser.add_argument("--refit", action="store_true",
+                        help="With --forecasts, ignore cached models and refit every model")
 
     args = parser.parse_args()
 
-    if args.init:
-        init_database()
-    elif args.full:
-        full_sync()
-    elif args.sync:
-        incremental_sync()
-    elif args.stats:
-        show_stats()
-    elif args.query:
-        run_query(args.query)
+    countries = None
+    if args.countries:
+        countries = [code.strip().upper() for code in args.countries.split(",") if code.strip()]
+        if args.use_async or args.stream or args.checkpoint or args.resume:
+            parser.error("--countries cannot be combined with --async, --stream, "
+                         "--checkpoint or --resume")
+
+    if args.staged and (args.checkpoint or args.resume):
+        parser.error("--staged cannot be combined with --checkpoint or --resume "
+                     "(checkpoints in a discarded staging copy cannot be resumed)")
+
+    # Forecasts are precomputed in the sync's own writer session after a successful import
+    forecasts = not args.no_forecasts
+
+    try:
+        if args.init:
+            init_database(layout=args.layout)
+        elif countries and (args.full or args.sync):
+            multi_country_sync(countries, incremental=args.sync, bulk=args.bulk,
+                               batch_size=args.batch_size, window_months=args.window_months,
+                               workers=args.workers, use_cache=not args.no_cache,
+                               by_modified=args.modified, staged=args.staged,
+                               forecasts=forecasts)
+        elif args.full and (args.checkpoint or args.resume):
+            checkpointed_full_sync(bulk=args.bulk, batch_size=args.batch_size,
+                                   window_months=args.window_months, resume=args.resume,
+                                   use_cache=not args.no_cache, forecasts=forecasts)
+        elif args.full:
+            full_sync(bulk=args.bulk, batch_size=args.batch_size,
+                      window_months=args.window_months, workers=args.workers,
+                      use_async=args.use_async, stream_batch=args.stream,
+                      use_cache=not args.no_cache, staged=args.staged,
+                      forecasts=forecasts)
+        elif args.sync:
+            incremental_sync(bulk=args.bulk, batch_size=args.batch_size,
+                             window_months=args.window_months, workers=args.workers,
+                             use_async=args.use_async, stream_batch=args.stream,
+                             use_cache=not args.no_cache, by_modified=args.modified,
+                             staged=args.staged, forecasts=forecasts)
+        elif args.load_parquet:
+            load_parquet(args.load_parquet, staged=args.staged, forecasts=forecasts)
+        elif args.recluster:
+            recluster(staged=args.staged)
+        elif args.refresh_aggregates:
+            refresh_aggregates()
+        elif args.forecasts:
+            precompute_forecasts(staged=args.staged, refit=args.refit)
+        elif args.stats:
+            show_stats()
+        elif args.query:
+            run_query(args.query)
+    except DatabaseLockedError as e:
+        print(f"[ERROR] {e}")
+        print("        Another sync is running; try again when it finishes.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+"""
+AsyncFEWSNETClient against a local aiohttp test server.
+
+Covers Retry-After handling on HTTP 429, the retry limit, and the request
+rate enforced by the token bucket.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fewsnet_async_client import AsyncFEWSNETClient, TokenBucket
+
+
+def run_with_server(handler, client_kwargs, body):
+    """
+    Serve handler on /marketpricefacts/ and run body(client) against it.
+
+    Args:
+        handler: aiohttp request handler
+        client_kwargs: Keyword arguments for AsyncFEWSNETClient
+        body: Coroutine function taking the client
+
+    Returns:
+        Whatever body returns
+    """
+    async def main():
+        app = web.Application()
+        app.router.add_get("/marketpricefacts/", handler)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url(""))
+            async with AsyncFEWSNETClient(base_url=base_url, **client_kwargs) as client:
+                return await body(client)
+
+    return asyncio.run(main())
+
+
+def price_rows(request):
+    """One JSON row echoing the request's window."""
+    return [{"period_date": request.query.get("start_date"), "value": 1.0}]
+
+
+def test_retry_after_is_honoured_on_429():
+    arrivals = []
+
+    async def handler(request):
+        arrivals.append(time.monotonic())
+        if len(arrivals) == 1:
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        return web.json_response(price_rows(request))
+
+    df = run_with_server(
+        handler, {"max_retries": 3},
+        lambda client: client.get_market_prices(start_date="2020-01-01"),
+    )
+
+    assert len(df) == 1
+    assert len(arrivals) == 2
+    # Waited the server's 1s, not the 2s+ exponential backoff
+    assert 0.9 <= arrivals[1] - arrivals[0] < 2
+
+
+def test_gives_up_after_max_retries():
+    arrivals = []
+
+    async def handler(request):
+        arrivals.append(time.monotonic())
+        return web.Response(status=503, headers={"Retry-After": "0"})
+
+    async def body(client):
+        with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+            await client.get_market_prices(start_date="2020-01-01")
+        return excinfo.value
+
+    error = run_with_server(handler, {"max_retries": 2}, body)
+
+    assert error.status == 503
+    assert len(arrivals) == 3  # First attempt plus max_retries
+
+
+def test_requests_are_rate_limited():
+    rate, burst, n_requests = 10.0, 2, 12
+    arrivals = []
+
+    async def handler(request):
+        arrivals.append(time.monotonic())
+        return web.json_response(price_rows(request))
+
+    async def body(client):
+        start = time.monotonic()
+        df = await client.get_market_prices_many(
+            [{"start_date": f"20{i:02d}-01-01"} for i in range(n_requests)]
+        )
+        return start, df
+
+    start, df = run_with_server(
+        handler, {"rate": rate, "burst": burst, "max_connections": n_requests}, body
+    )
+
+    assert len(df) == n_requests
+    # The burst goes out at once; the rest at no more than `rate` per second
+    assert arrivals[burst - 1] - start < 0.5 / rate + 0.2
+    assert arrivals[-1] - start >= (n_requests - burst) / rate * 0.95
+    for i in range(len(arrivals)):
+        for j in range(i + burst, len(arrivals)):
+            elapsed = arrivals[j] - arrivals[i]
+            assert j - i <= burst + elapsed * rate + 1e-6
+
+
+def test_windowed_fetch_keeps_date_order():
+    async def handler(request):
+        # Answer later windows first, so completion order differs from date order
+        await asyncio.sleep(0.05 if request.query["start_date"] < "2008" else 0)
+        return web.json_response(price_rows(request))
+
+    df = run_with_server(
+        handler, {"rate": 100.0, "burst": 10},
+        lambda client: client.get_market_prices_windowed(
+            "2005-01-01", "2010-12-31", window_months=12
+        ),
+    )
+
+    assert df["period_date"].tolist() == sorted(df["period_date"])
+    assert len(df) == 6
+
+
+def test_token_bucket_spacing():
+    async def take(n):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        start = time.monotonic()
+        for _ in range(n):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(take(5)) >= 4 / 20.0 * 0.95
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,171 @@
+"""
+The row-by-row and bulk ingest paths must build the same database.
+
+Both paths are run on the bundled sample CSVs (which include 'No Data' rows
+without a value) and on small frames with duplicate keys and revisions.
+"""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.fews_database import FEWSDatabase
+from fewsnet_haiti_downloader import PRICE_DTYPES, apply_column_plan
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Natural-key view of the stored observations, independent of surrogate ids
+OBSERVATIONS_SQL = """
+    SELECT m.fews_id, p.name, p.product_source, u.name AS unit, po.period_date,
+           po.price_type, po.currency, po.value, po.exchange_rate,
+           po.common_unit_price, po.common_currency_price, po.collection_status,
+           po.fews_dataseries_id, po.api_modified_at
+    FROM price_observations po
+    JOIN markets m ON po.market_id = m.id
+    JOIN products p ON po.product_id = p.id
+    JOIN units u ON po.unit_id = u.id
+    ORDER BY ALL
+"""
+
+
+def sample_prices() -> pd.DataFrame:
+    """The bundled CSV exports, typed like an API response."""
+    frames = [
+        apply_column_plan(pd.read_csv(path), dtypes=PRICE_DTYPES)
+        for path in sorted(DATA_DIR.glob("*.csv"))
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def sync_both_ways(tmp_path, frames, setup=None) -> dict:
+    """
+    Sync each frame in turn with the row path and with the bulk path.
+
+    Args:
+        tmp_path: Directory for the two databases
+        frames: DataFrames to sync, in order
+        setup: Optional callable run on each new database before syncing
+
+    Returns:
+        Dictionary mapping bulk (False/True) to (list of stats, observations,
+        database path)
+    """
+    results = {}
+    for bulk in (False, True):
+        db_path = tmp_path / f"bulk_{bulk}.duckdb"
+        with FEWSDatabase(db_path) as db:
+            db.create_tables()
+            if setup:
+                setup(db)
+            stats = [db.sync_dataframe(df, bulk=bulk) for df in frames]
+            results[bulk] = (stats, db.query(OBSERVATIONS_SQL), db_path)
+    return results
+
+
+def test_sample_csvs_sync_identically(tmp_path):
+    df = sample_prices()
+    assert df["value"].isna().any(), "sample should include rows without a value"
+
+    results = sync_both_ways(tmp_path, [df, df])
+    (row_stats, row_obs, _), (bulk_stats, bulk_obs, _) = results[False], results[True]
+
+    assert row_stats == bulk_stats
+    assert row_stats[0]["errors"] == 0
+    assert row_stats[0]["skipped"] == df["value"].isna().sum()
+    assert row_stats[1]["skipped"] == len(df)
+    pd.testing.assert_frame_equal(row_obs, bulk_obs)
+    assert not row_obs["value"].isna().any()
+
+
+def test_revisions_and_missing_values_sync_identically(tmp_path):
+    df = sample_prices().dropna(subset=["value"]).head(50).reset_index(drop=True)
+
+    # Revise some prices, blank some others, and repeat a key within the frame
+    revised = df.copy()
+    revised.loc[:9, "value"] = revised.loc[:9, "value"] * 2
+    revised.loc[10:14, "value"] = np.nan
+    revised = pd.concat([revised, revised.iloc[[20]].assign(value=1.0)], ignore_index=True)
+
+    results = sync_both_ways(tmp_path, [df, revised])
+    (row_stats, row_obs, _), (bulk_stats, bulk_obs, _) = results[False], results[True]
+
+    assert row_stats == bulk_stats
+    assert row_stats[1]["errors"] == 0
+    pd.testing.assert_frame_equal(row_obs, bulk_obs)
+
+
+def test_duplicate_products_resolve_to_same_id(tmp_path):
+    df = sample_prices().dropna(subset=["value"]).head(20).assign(product_source=None)
+    product = df["product"].iloc[0]
+
+    def legacy_duplicates(db):
+        # UNIQUE (name, product_source) allows repeated NULL sources
+        for _ in range(2):
+            db.con.execute(
+                "INSERT INTO products (name, product_source) VALUES (?, NULL)", [product]
+            )
+
+    results = sync_both_ways(tmp_path, [df], setup=legacy_duplicates)
+
+    product_ids = {}
+    for bulk, (_, _, db_path) in results.items():
+        with FEWSDatabase(db_path) as db:
+            product_ids[bulk] = [row[0] for row in db.con.execute("""
+                SELECT DISTINCT po.product_id
+                FROM price_observations po JOIN products p ON po.product_id = p.id
+                WHERE p.name = ?
+            """, [product]).fetchall()]
+    oldest = 1
+    assert product_ids[False] == product_ids[True] == [oldest]
+
+
+def test_missing_product_source_syncs_identically(tmp_path):
+    # Typed like an API response, so the missing source is a categorical NaN
+    df = sample_prices().dropna(subset=["value"]).head(20).reset_index(drop=True)
+    df["product_source"] = df["product_source"].astype("object")
+    df.loc[:9, "product_source"] = np.nan
+    df = apply_column_plan(df, dtypes=PRICE_DTYPES)
+
+    results = sync_both_ways(tmp_path, [df])
+    (row_stats, row_obs, _), (bulk_stats, bulk_obs, _) = results[False], results[True]
+
+    assert row_stats == bulk_stats
+    assert row_stats[0]["errors"] == 0
+    assert row_stats[0]["inserted"] == len(df)
+    assert row_obs["product_source"].isna().sum() == 10
+    pd.testing.assert_frame_equal(row_obs, bulk_obs)
+
+
+def test_sync_batches_stream_and_database_errors(tmp_path):
+    df = sample_prices().dropna(subset=["value"]).head(20).reset_index(drop=True)
+
+    def interrupted():
+        yield df.iloc[:10]
+        raise ConnectionError("connection reset")
+
+    with FEWSDatabase(tmp_path / "stream.duckdb") as db:
+        db.create_tables()
+
+        # A failing stream keeps the batches already synced
+        stats = db.sync_batches(interrupted(), bulk=True)
+        assert stats["stream_error"] == "connection reset"
+        assert stats["fetched"] == stats["inserted"] == 10
+
+        # A failing ingest (e.g. disk full) is not a stream interruption
+        def disk_full(*args, **kwargs):
+            raise duckdb.IOException("No space left on device")
+
+        db.sync_dataframe = disk_full
+        with pytest.raises(duckdb.IOException):
+            db.sync_batches(iter([df.iloc[10:]]), bulk=True)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))